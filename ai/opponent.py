@@ -0,0 +1,68 @@
+"""
+AI Opponent
+-----------
+Paddle controller for the right-hand player. Moves to where the ball will
+arrive, aims away from the player's predicted position and applies
+ELO-scaled error.
+"""
+import random
+import config
+from ai.trajectory import InterceptPredictor
+
+class AIOpponent:
+    def __init__(self, rng=None, predict_intercept=None):
+        # Own RNG so sessions can be seeded and replayed
+        self.rng = rng or random.Random()
+        if predict_intercept is None:
+            predict_intercept = config.AI_PREDICT_INTERCEPT
+        self.intercept_predictor = InterceptPredictor() if predict_intercept else None
+
+    def update(self, game, predicted_player_y=None):
+        """
+        Advanced AI:
+        1. Targets the ball's arrival point (Basic)
+        2. Uses TCN Prediction to aim away from player (Advanced)
+        3. Applies ELO error (Human-like)
+        """
+        ball = game.ball
+        ai_paddle = game.ai_paddle
+
+        # 1. Basic Target: where the ball will cross our paddle face
+        # (cached until the ball's velocity changes), else the ball itself
+        ball_y = ball.y
+        if self.intercept_predictor is not None:
+            intercept_y = self.intercept_predictor.predict(ball, ai_paddle.x - ball.radius, game.height)
+            if intercept_y is not None:
+                ball_y = intercept_y
+        target_y = ball_y - ai_paddle.height // 2
+
+        # 2. Advanced Strategy: Aim away from player
+        # Only apply strategy if ball is moving towards AI and we have a prediction
+        if ball.vx > 0 and predicted_player_y is not None:
+            # If player is going UP (low Y), aim DOWN (add offset)
+            # If player is going DOWN (high Y), aim UP (subtract offset)
+
+            # Center of screen
+            center_y = config.SCREEN_HEIGHT / 2
+
+            # If player is predicted to be in top half, try to hit to bottom half
+            if predicted_player_y < center_y:
+                strategic_offset = 30 # Aim lower
+            else:
+                strategic_offset = -30 # Aim higher
+
+            target_y += strategic_offset
+
+        # 3. Apply ELO Error (Human-like imperfection)
+        # BUG FIX: Apply error ALWAYS, not just when far away.
+        # Otherwise AI snaps to perfection at the last second.
+        error_offset = (self.rng.random() - 0.5) * 2 * game.ai_error_margin
+        target_y += error_offset
+
+        # Move AI
+        if ball.vx > 0:
+            ai_paddle.set_target(target_y)
+        else:
+            # Return to center when idle
+            center_y = game.height // 2 - ai_paddle.height // 2
+            ai_paddle.set_target(center_y)
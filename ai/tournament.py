@@ -0,0 +1,255 @@
+"""
+AI-vs-Player Tournament for ELO Calibration
+-------------------------------------------
+Runs headless matches (BatchPongSim) in a multiprocessing pool, one task
+per rating band. Each task measures the player win rate against the AI
+parameters EloSystem currently maps that rating to, then bisects the AI
+error margin until the win rate hits config.TARGET_WIN_RATE, and the
+fitted rating -> parameter table is written as JSON.
+
+Player models:
+    scripted - anticipating tracker whose reaction delay and aim error
+               improve with rating (a stand-in for a player at that rating)
+    replay   - finger traces from recorded sessions (data/replays)
+
+Usage:
+    python -m ai.tournament --player scripted --games 256 --seconds 60
+"""
+import argparse
+import glob
+import json
+import os
+import time
+from multiprocessing import Pool
+import numpy as np
+import config
+from ai.trajectory import predict_intercept_y
+from core.batch_sim import BatchPongSim, RESULT_PLAYER_WON, RESULT_AI_WON
+from core.elo_system import EloSystem
+
+# Error margin search range for the fit
+MAX_ERROR_MARGIN = 400.0
+FIT_ITERATIONS = 8
+
+
+class ScriptedPlayer:
+    """Anticipating tracker with a reaction delay and a per-rally aim error"""
+    def __init__(self, num_games, rating, rng):
+        skill = _normalize_rating(rating)
+        self.delay = int(round(6 - 4 * skill))   # frames (200ms -> 67ms)
+        self.aim_sigma = 60.0 - 45.0 * skill     # px
+        self.rng = rng
+        self.history = []
+        self.aim_error = rng.normal(0, self.aim_sigma, num_games)
+        self.last_vx = None
+
+    def act(self, sim):
+        # Remember ball state, react to the state `delay` frames ago
+        self.history.append((sim.ball_x.copy(), sim.ball_y.copy(),
+                             sim.ball_vx.copy(), sim.ball_vy.copy()))
+        if len(self.history) > self.delay + 1:
+            self.history.pop(0)
+        x, y, vx, vy = self.history[0]
+
+        # New aim error each time the ball turns towards the player
+        if self.last_vx is not None:
+            turned = (sim.ball_vx < 0) & (self.last_vx >= 0)
+            self.aim_error[turned] = self.rng.normal(0, self.aim_sigma, turned.sum())
+        self.last_vx = sim.ball_vx.copy()
+
+        r = sim.ball_radius
+        face_x = sim.player_x + sim.paddle_width + r
+        intercept = predict_intercept_y(x, y, vx, vy, face_x, r, sim.height)
+        target = np.where(vx < 0, intercept, sim.height / 2) + self.aim_error
+        return target - sim.player_height / 2
+
+
+class ReplayPlayer:
+    """Plays back recorded finger Y traces (each game starts at a random offset)"""
+    def __init__(self, num_games, trace, rng):
+        self.trace = trace
+        self.offsets = rng.integers(0, len(trace), num_games)
+        self.frame = 0
+
+    def act(self, sim):
+        finger_y = self.trace[(self.offsets + self.frame) % len(self.trace)]
+        self.frame += 1
+        return finger_y - sim.player_height // 2
+
+
+def ai_targets(sim, error_margin, rng):
+    """Vectorized AIOpponent.update() (player paddle stands in for the TCN prediction)"""
+    r = sim.ball_radius
+    toward = sim.ball_vx > 0
+    face_x = sim.ai_x - r
+
+    ball_y = sim.ball_y
+    if config.AI_PREDICT_INTERCEPT:
+        ahead = toward & (sim.ball_x < face_x)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            intercept = predict_intercept_y(sim.ball_x, sim.ball_y, sim.ball_vx, sim.ball_vy,
+                                            face_x, r, sim.height)
+        ball_y = np.where(ahead, intercept, sim.ball_y)
+    target = ball_y - sim.ai_height // 2
+
+    predicted_player_y = sim.player_y + sim.player_height / 2
+    target += np.where(predicted_player_y < config.SCREEN_HEIGHT / 2, 30, -30)
+    target += (rng.random(sim.num_games) - 0.5) * 2 * error_margin
+
+    center_y = sim.height // 2 - sim.ai_height // 2
+    return np.where(toward, target, center_y)
+
+
+def play_matches(rating, error_margin, player_kind, num_games, seconds, seed, trace=None):
+    """
+    Simulate num_games games for `seconds` of game time.
+    Returns: (player_points, ai_points)
+    """
+    rng = np.random.default_rng(seed)
+    sim = BatchPongSim(num_games)
+    if player_kind == 'replay':
+        player = ReplayPlayer(num_games, trace, rng)
+    else:
+        player = ScriptedPlayer(num_games, rating, rng)
+
+    # Inputs update at camera rate, physics at PHYSICS_HZ (as in the live game)
+    dt = 1.0 / config.PHYSICS_HZ
+    steps_per_frame = max(1, int(round(config.PHYSICS_HZ / config.FPS_TARGET)))
+    frames = int(seconds * config.FPS_TARGET)
+
+    player_points = 0
+    ai_points = 0
+    actions = np.empty((num_games, 2))
+    for _ in range(frames):
+        actions[:, 0] = player.act(sim)
+        actions[:, 1] = ai_targets(sim, error_margin, rng)
+        for _ in range(steps_per_frame):
+            results = sim.step(actions, dt)
+            player_points += int(np.count_nonzero(results == RESULT_PLAYER_WON))
+            ai_points += int(np.count_nonzero(results == RESULT_AI_WON))
+
+    return player_points, ai_points
+
+
+def _win_rate(points):
+    player_points, ai_points = points
+    total = player_points + ai_points
+    return player_points / total if total else 0.5
+
+
+def _normalize_rating(rating):
+    """Same 800 -> 2000 normalization as EloSystem.get_ai_parameters()"""
+    return max(0.0, min(1.0, (rating - 800) / (2000 - 800)))
+
+
+def calibrate_band(task):
+    """
+    Pool worker: measure and fit one rating band.
+    Bisects error_margin (more error -> higher player win rate).
+    """
+    rating, player_kind, num_games, seconds, seed, trace = task
+
+    elo = EloSystem(save_file=None)
+    elo.player_rating = rating
+    params = elo.get_ai_parameters()
+
+    def evaluate(error_margin):
+        # Same seed for every evaluation (common random numbers) keeps the fit monotone
+        return play_matches(rating, error_margin, player_kind, num_games, seconds, seed, trace)
+
+    current_points = evaluate(params['error_margin'])
+    current_win_rate = _win_rate(current_points)
+
+    low, high = 0.0, MAX_ERROR_MARGIN
+    best_error, best_win_rate = params['error_margin'], current_win_rate
+    for _ in range(FIT_ITERATIONS):
+        mid = (low + high) / 2
+        win_rate = _win_rate(evaluate(mid))
+        if abs(win_rate - config.TARGET_WIN_RATE) < abs(best_win_rate - config.TARGET_WIN_RATE):
+            best_error, best_win_rate = mid, win_rate
+        if win_rate < config.TARGET_WIN_RATE:
+            low = mid
+        else:
+            high = mid
+
+    return {
+        'rating': rating,
+        'speed': params['speed'],
+        'reaction_delay': params['reaction_delay'],
+        'current_error_margin': params['error_margin'],
+        'current_win_rate': current_win_rate,
+        'current_points': sum(current_points),
+        'error_margin': best_error,
+        'fitted_win_rate': best_win_rate
+    }
+
+
+def load_replay_trace(pattern):
+    """Concatenate finger Y positions from recorded replays"""
+    trace = []
+    for path in sorted(glob.glob(pattern)):
+        with open(path, 'r') as f:
+            f.readline()  # header
+            for line in f:
+                frame = json.loads(line)
+                if frame['finger']:
+                    trace.append(frame['finger'][1])
+    return np.array(trace, dtype=np.float64)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Calibrate ELO -> AI parameters with headless matches")
+    parser.add_argument('--player', choices=['scripted', 'replay'], default='scripted')
+    parser.add_argument('--replays', default=os.path.join(config.REPLAYS_DIR, '*.jsonl'),
+                        help="Glob of replay files for --player replay")
+    parser.add_argument('--ratings', default='800:2000:100',
+                        help="Rating bands as start:stop:step (inclusive)")
+    parser.add_argument('--games', type=int, default=256, help="Parallel games per evaluation")
+    parser.add_argument('--seconds', type=float, default=60.0, help="Game time per evaluation")
+    parser.add_argument('--workers', type=int, default=None, help="Pool size (default: all cores)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--out', default=os.path.join(config.DATA_DIR, 'ai_calibration.json'))
+    args = parser.parse_args()
+
+    start, stop, step = (int(v) for v in args.ratings.split(':'))
+    ratings = list(range(start, stop + 1, step))
+
+    trace = None
+    if args.player == 'replay':
+        trace = load_replay_trace(args.replays)
+        if len(trace) == 0:
+            print(f"No finger data found in {args.replays}")
+            return
+
+    tasks = [(rating, args.player, args.games, args.seconds, args.seed + i, trace)
+             for i, rating in enumerate(ratings)]
+
+    print(f"Calibrating {len(ratings)} rating bands ({args.player} player, "
+          f"{args.games} games x {args.seconds:.0f}s per evaluation)...")
+    started = time.time()
+    with Pool(processes=args.workers) as pool:
+        table = pool.map(calibrate_band, tasks)
+    elapsed = time.time() - started
+
+    print(f"\nTarget player win rate: {config.TARGET_WIN_RATE:.2f}")
+    print(f"{'Rating':>6} | {'Error (now)':>11} | {'Win (now)':>9} | {'Points':>6} | "
+          f"{'Error (fit)':>11} | {'Win (fit)':>9}")
+    for row in table:
+        print(f"{row['rating']:>6} | {row['current_error_margin']:>11.1f} | {row['current_win_rate']:>9.2f} | "
+              f"{row['current_points']:>6} | {row['error_margin']:>11.1f} | {row['fitted_win_rate']:>9.2f}")
+    print(f"\nFinished in {elapsed:.1f}s")
+
+    os.makedirs(os.path.dirname(args.out) or '.', exist_ok=True)
+    with open(args.out, 'w') as f:
+        json.dump({
+            'player_model': args.player,
+            'target_win_rate': config.TARGET_WIN_RATE,
+            'games': args.games,
+            'seconds': args.seconds,
+            'table': table
+        }, f, indent=2)
+    print(f"Saved calibration table to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+Ball Trajectory Prediction
+--------------------------
+Closed-form solution for where the ball will cross a vertical line,
+including any number of top/bottom wall reflections. Between velocity
+changes the answer is constant, so InterceptPredictor caches it and only
+re-solves after a paddle hit, wall bounce, power-up or reset.
+"""
+
+def predict_intercept_y(x, y, vx, vy, target_x, radius, height):
+    """
+    Ball center Y when its center reaches target_x.
+
+    The ball center bounces between radius and height - radius; unfolding
+    those reflections turns the path into a straight line, and folding the
+    straight-line answer back gives the reflected position.
+
+    Works on floats or NumPy arrays. The result is only meaningful when the
+    ball is moving towards target_x (time to reach it is positive).
+    """
+    t = (target_x - x) / vx
+    span = height - 2 * radius
+    u = (y + vy * t - radius) % (2 * span)
+    return radius + span - abs(u - span)
+
+
+class InterceptPredictor:
+    def __init__(self):
+        self._key = None
+        self._intercept_y = None
+
+    def predict(self, ball, target_x, height):
+        """
+        Where the ball will cross target_x, or None if it's moving away.
+        O(1): recomputed only when the ball's velocity changes.
+        """
+        # Position moves linearly while velocity is unchanged, so the
+        # intercept only changes with velocity (or a reset teleport)
+        key = (ball.vx, ball.vy, ball.reset_count, target_x, height)
+        if key != self._key:
+            self._key = key
+            if (target_x - ball.x) * ball.vx <= 0:
+                self._intercept_y = None
+            else:
+                self._intercept_y = predict_intercept_y(ball.x, ball.y, ball.vx, ball.vy,
+                                                        target_x, ball.radius, height)
+        return self._intercept_y
@@ -4,6 +4,12 @@
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
 FPS_TARGET = 30
+DISPLAY_THREAD = True  # Draw/present on a separate thread (False if the GUI must stay on the main thread, e.g. macOS)
+
+# Physics timing
+# Velocities are expressed in pixels per reference frame (1 / FPS_TARGET s)
+PHYSICS_HZ = 120  # Fixed simulation rate, independent of camera FPS
+PHYSICS_MAX_STEPS = 12  # Max physics steps per rendered frame (stall guard)
 
 # Game settings
 BALL_RADIUS = 10
@@ -15,13 +21,30 @@ PADDLE_SPEED = 5
 # ML settings
 LSTM_SEQUENCE_LENGTH = 30  # 1 second at 30 FPS
 LSTM_PREDICTION_HORIZON = 10  # 0.33 seconds ahead
+TCN_BACKEND = 'numpy'  # Gesture predictor runtime: 'numpy' (no TensorFlow), 'keras', 'tflite', 'onnxruntime' or 'auto' (fastest available)
+TCN_WARMUP_RUNS = 50  # Untimed inference calls at load (traces/compiles the backend)
+TCN_LATENCY_RUNS = 200  # Timed calls after warmup for the startup median/p99 latency report
+TCN_INTRA_OP_THREADS = 1  # Threads within an op (keras, tflite, onnxruntime; one window per call)
+TCN_INTER_OP_THREADS = 1  # TensorFlow threads across independent ops (keras backend)
 EMOTION_DETECTION_INTERVAL = 3  # Detect emotion every 3rd frame (10 FPS)
+EMOTION_WORKER_PROCESS = True  # Run emotion detection in a separate process (results arrive asynchronously)
 EMOTION_ACCURACY_TARGET = 0.95  # 95% accuracy before stopping data collection
 
+# Hand tracking
+HAND_ROI_TRACKING = False  # Track inside a crop around the last hand position, full frame on loss (not yet measured against full-frame tracking)
+HAND_ROI_PADDING = 1.0  # Crop margin, as a fraction of the hand's bounding box size
+HAND_ROI_MIN_SIZE = 192  # px, smallest crop side (MediaPipe palm model input size)
+FINGER_FILTER = True  # One-Euro smoothing + latency compensation of the finger for paddle control
+FINGER_FILTER_MIN_CUTOFF = 1.0  # Hz, smoothing at rest (lower = smoother, more lag)
+FINGER_FILTER_BETA = 0.05  # Cutoff increase per px/s of speed (higher = less lag when moving)
+FINGER_FILTER_D_CUTOFF = 1.0  # Hz, smoothing of the velocity estimate
+FINGER_PREDICT_MAX_LEAD = 0.1  # s, cap on extrapolation from capture time to now
+
 # Adaptive difficulty settings
 DIFFICULTY_WINDOW_SIZE = 100  # Frames to consider for skill assessment
 TARGET_WIN_RATE = 0.55  # Target 55% player win rate
 ADJUSTMENT_RATE = 0.05  # How fast difficulty adapts
+AI_PREDICT_INTERCEPT = True  # AI aims at the ball's predicted arrival point, not its current Y
 
 # Power-up settings
 POWERUP_SPAWN_MIN = 10  # Minimum seconds between spawns
@@ -45,3 +68,4 @@ MODELS_DIR = "models"
 GAMEPLAY_SESSIONS_DIR = "data/gameplay_sessions"
 PLAYER_METRICS_DIR = "data/player_metrics"
 EMOTION_DATA_DIR = "data/emotion_data"
+REPLAYS_DIR = "data/replays"
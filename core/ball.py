@@ -2,6 +2,10 @@
 Ball physics and collision detection for Pong game
 """
 import config
+from core.collision import sweep_circle_rect
+
+# Safety cap on wall/paddle contacts resolved within a single step
+MAX_CONTACTS_PER_STEP = 8
 
 class Ball:
     def __init__(self, x, y):
@@ -14,6 +18,10 @@ class Ball:
         self.vy = self.speed
         self.reset_count = 0
         
+        # Position at the start of the last physics step (for interpolation)
+        self.last_x = x
+        self.last_y = y
+        
     def increase_speed(self, factor=1.05):
         """Increase ball speed by a factor"""
         self.vx *= factor
@@ -32,60 +40,98 @@ class Ball:
         self.vx = self.speed * direction_x
         self.vy = self.speed * direction_y
     
-    def update(self, width, height):
-        """Update ball position and handle wall collisions"""
-        self.x += self.vx
-        self.y += self.vy
+    def _bounce_off_paddle(self, paddle):
+        """Reflect off a paddle with spin effect"""
+        # Reverse horizontal direction
+        self.vx = -self.vx
         
-        # Top/bottom wall collision
-        if self.y - self.radius <= 0 or self.y + self.radius >= height:
-            self.vy = -self.vy
-            # Keep ball in bounds
-            if self.y - self.radius < 0:
-                self.y = self.radius
-            if self.y + self.radius > height:
-                self.y = height - self.radius
+        # Add spin based on where ball hits paddle
+        paddle_center = paddle.y + paddle.height / 2
+        hit_pos = (self.y - paddle_center) / (paddle.height / 2)
         
-        # Check for scoring (left/right boundaries)
-        if self.x - self.radius <= 0:
-            return 'right_scores'
-        if self.x + self.radius >= width:
-            return 'left_scores'
+        # Adjust vertical velocity based on hit position
+        self.vy += hit_pos * 2
         
-        return None
+        # Limit vertical velocity
+        max_vy = self.speed * 1.5
+        if abs(self.vy) > max_vy:
+            self.vy = max_vy if self.vy > 0 else -max_vy
+        
+        # Move ball outside paddle to prevent multiple collisions
+        if self.vx > 0:
+            self.x = paddle.x + paddle.width + self.radius
+        else:
+            self.x = paddle.x - self.radius
     
-    def check_paddle_collision(self, paddle):
-        """Check and handle paddle collision with spin effect"""
-        # Simple AABB collision detection
-        if (self.x - self.radius <= paddle.x + paddle.width and
-            self.x + self.radius >= paddle.x and
-            self.y + self.radius >= paddle.y and
-            self.y - self.radius <= paddle.y + paddle.height):
+    def advance(self, width, height, paddles, dt=None, on_paddle_hit=None):
+        """
+        Move the ball with continuous (swept) collision detection.
+        
+        Finds the exact time of impact with walls and paddles inside the
+        step, resolves it and keeps moving for the remaining time, so a fast
+        ball can't tunnel through a paddle. on_paddle_hit(paddle) is called
+        after each paddle bounce (e.g. to speed the ball up).
+        
+        Returns: 'left_scores', 'right_scores' or None
+        """
+        remaining = 1.0 if dt is None else dt * config.FPS_TARGET
+        r = self.radius
+        
+        for _ in range(MAX_CONTACTS_PER_STEP):
+            dx = self.vx * remaining
+            dy = self.vy * remaining
+            
+            t_hit = None
+            hit_paddle = None
             
-            # Reverse horizontal direction
-            self.vx = -self.vx
+            # Top/bottom walls (only when moving into them)
+            if dy < 0:
+                t_hit = max(0.0, (r - self.y) / dy)
+            elif dy > 0:
+                t_hit = max(0.0, (height - r - self.y) / dy)
+            if t_hit is not None and t_hit > 1:
+                t_hit = None
             
-            # Add spin based on where ball hits paddle
-            paddle_center = paddle.y + paddle.height / 2
-            hit_pos = (self.y - paddle_center) / (paddle.height / 2)
+            # Paddles (only when moving towards them, not when leaving)
+            for paddle in paddles:
+                paddle_center_x = paddle.x + paddle.width / 2
+                if (dx > 0) != (paddle_center_x > self.x) or dx == 0:
+                    continue
+                hit = sweep_circle_rect(self.x, self.y, dx, dy, r,
+                                        paddle.x, paddle.y,
+                                        paddle.x + paddle.width, paddle.y + paddle.height)
+                if hit is not None and (t_hit is None or hit[0] < t_hit):
+                    t_hit = hit[0]
+                    hit_paddle = paddle
             
-            # Adjust vertical velocity based on hit position
-            self.vy += hit_pos * 2
+            if t_hit is None:
+                self.x += dx
+                self.y += dy
+                break
             
-            # Limit vertical velocity
-            max_vy = self.speed * 1.5
-            if abs(self.vy) > max_vy:
-                self.vy = max_vy if self.vy > 0 else -max_vy
+            # Move to the contact point and resolve
+            self.x += dx * t_hit
+            self.y += dy * t_hit
+            remaining *= 1.0 - t_hit
             
-            # Move ball outside paddle to prevent multiple collisions
-            if self.vx > 0:
-                self.x = paddle.x + paddle.width + self.radius
+            if hit_paddle is not None:
+                self._bounce_off_paddle(hit_paddle)
+                if on_paddle_hit:
+                    on_paddle_hit(hit_paddle)
             else:
-                self.x = paddle.x - self.radius
+                self.vy = -self.vy
+                self.y = min(max(self.y, r), height - r)
             
-            return True
+            if remaining <= 0:
+                break
         
-        return False
+        # Check for scoring (left/right boundaries)
+        if self.x - r <= 0:
+            return 'right_scores'
+        if self.x + r >= width:
+            return 'left_scores'
+        
+        return None
     
     def reset(self, x, y):
         """Reset ball to center"""
@@ -93,3 +139,16 @@ class Ball:
         self.y = y
         self.vx = -self.vx  # Reverse direction
         self.reset_count += 1
+        # Teleport: don't interpolate across the screen
+        self.last_x = x
+        self.last_y = y
+    
+    def store_position(self):
+        """Remember current position before a physics step"""
+        self.last_x = self.x
+        self.last_y = self.y
+    
+    def render_position(self, alpha):
+        """Position interpolated between the last two physics steps"""
+        return (self.last_x + (self.x - self.last_x) * alpha,
+                self.last_y + (self.y - self.last_y) * alpha)
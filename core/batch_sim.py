@@ -0,0 +1,278 @@
+"""
+Batch Pong Simulator
+--------------------
+Headless, NumPy-backed engine that steps N independent games at once.
+State is kept in struct-of-arrays form (one array per field) and every
+step reproduces PongGame.update(): paddle easing, swept paddle collisions
+with spin and speed caps, wall bounces, scoring and ball reset.
+"""
+import numpy as np
+import config
+from core.ball import MAX_CONTACTS_PER_STEP
+
+# Per-game step results
+RESULT_NONE = 0
+RESULT_PLAYER_WON = 1
+RESULT_AI_WON = -1
+
+
+class BatchPongSim:
+    def __init__(self, num_games, width=None, height=None):
+        self.num_games = num_games
+        self.width = width or config.SCREEN_WIDTH
+        self.height = height or config.SCREEN_HEIGHT
+
+        # Constants shared by every game (mirrors Ball/Paddle defaults)
+        self.ball_radius = config.BALL_RADIUS
+        self.ball_speed = float(config.BALL_SPEED)
+        self.max_vx = self.ball_speed * 2.5
+        self.max_vy = self.ball_speed * 1.5
+        self.paddle_width = config.PADDLE_WIDTH
+        self.player_x = 30
+        self.ai_x = self.width - 45
+
+        n = num_games
+        # Ball
+        self.ball_x = np.empty(n)
+        self.ball_y = np.empty(n)
+        self.ball_vx = np.empty(n)
+        self.ball_vy = np.empty(n)
+
+        # Paddles (heights are per game so power-ups can resize them)
+        self.player_y = np.empty(n)
+        self.ai_y = np.empty(n)
+        self.player_height = np.empty(n)
+        self.ai_height = np.empty(n)
+
+        # Scoring / rally tracking
+        self.player_score = np.zeros(n, dtype=np.int64)
+        self.ai_score = np.zeros(n, dtype=np.int64)
+        self.rally_length = np.zeros(n, dtype=np.int64)
+        self.frame_count = 0
+
+        self.results = np.zeros(n, dtype=np.int8)
+
+        self.reset()
+
+    def reset(self, mask=None):
+        """Reset games to their initial state (all games if mask is None)"""
+        if mask is None:
+            mask = np.ones(self.num_games, dtype=bool)
+
+        self.ball_x[mask] = self.width // 2
+        self.ball_y[mask] = self.height // 2
+        self.ball_vx[mask] = self.ball_speed
+        self.ball_vy[mask] = self.ball_speed
+
+        self.player_y[mask] = self.height // 2 - 40
+        self.ai_y[mask] = self.height // 2 - 40
+        self.player_height[mask] = config.PADDLE_HEIGHT
+        self.ai_height[mask] = config.PADDLE_HEIGHT
+
+        self.player_score[mask] = 0
+        self.ai_score[mask] = 0
+        self.rally_length[mask] = 0
+
+    def step(self, actions, dt=None):
+        """
+        Advance every game by one physics step.
+
+        Args:
+            actions: (N, 2) array of paddle target Y positions
+                     (column 0 = player, column 1 = AI), same units as
+                     Paddle.set_target()
+            dt: step length in seconds (defaults to one 1 / FPS_TARGET frame)
+
+        Returns:
+            (N,) int8 array of RESULT_* codes for this step
+        """
+        actions = np.asarray(actions, dtype=np.float64)
+        self.frame_count += 1
+
+        if dt is None:
+            frames = 1.0
+            easing = 0.3
+        else:
+            frames = dt * config.FPS_TARGET
+            easing = 1.0 - 0.7 ** frames
+
+        # 1. Paddles
+        self._update_paddles(self.player_y, self.player_height, actions[:, 0], easing)
+        self._update_paddles(self.ai_y, self.ai_height, actions[:, 1], easing)
+
+        # 2. Ball movement with swept wall/paddle collisions
+        self._advance_balls(frames)
+
+        r = self.ball_radius
+
+        # 3. Scoring (left boundary is checked first, like Ball.advance)
+        ai_won = self.ball_x - r <= 0
+        player_won = ~ai_won & (self.ball_x + r >= self.width)
+
+        self.results.fill(RESULT_NONE)
+        self.results[player_won] = RESULT_PLAYER_WON
+        self.results[ai_won] = RESULT_AI_WON
+
+        self.player_score += player_won
+        self.ai_score += ai_won
+
+        scored = ai_won | player_won
+        if scored.any():
+            self._reset_ball(scored)
+
+        return self.results.copy()
+
+    def _update_paddles(self, y, height, target, easing):
+        """Vectorized Paddle.update(): ease part of the way to the target"""
+        max_y = self.height - height
+        target = np.minimum(np.maximum(target, 0), max_y)
+
+        diff = target - y
+        far = np.abs(diff) > 1
+        np.copyto(y, np.where(far, y + diff * easing, target))
+
+        np.copyto(y, np.minimum(np.maximum(y, 0), max_y))
+
+    def _advance_balls(self, frames):
+        """Vectorized Ball.advance(): resolve contacts in time-of-impact order"""
+        n = self.num_games
+        r = self.ball_radius
+        remaining = np.full(n, float(frames))
+        active = np.ones(n, dtype=bool)
+        paddles = ((self.player_x, self.player_y, self.player_height),
+                   (self.ai_x, self.ai_y, self.ai_height))
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            for _ in range(MAX_CONTACTS_PER_STEP):
+                dx = self.ball_vx * remaining
+                dy = self.ball_vy * remaining
+
+                # Top/bottom walls (only when moving into them)
+                t_wall = np.where(dy < 0, (r - self.ball_y) / dy,
+                                  np.where(dy > 0, (self.height - r - self.ball_y) / dy, np.inf))
+                t_hit = np.where(t_wall <= 1, np.maximum(t_wall, 0.0), np.inf)
+                hit_kind = np.where(np.isfinite(t_hit), 0, -1)
+
+                # Paddles (only when moving towards them)
+                for kind, (paddle_x, paddle_y, paddle_height) in enumerate(paddles, start=1):
+                    towards = (dx != 0) & ((dx > 0) == (paddle_x + self.paddle_width / 2 > self.ball_x))
+                    t = _sweep_circle_rect(self.ball_x, self.ball_y, dx, dy, r,
+                                           paddle_x, paddle_y,
+                                           paddle_x + self.paddle_width, paddle_y + paddle_height)
+                    closer = towards & (t < t_hit)
+                    t_hit = np.where(closer, t, t_hit)
+                    hit_kind = np.where(closer, kind, hit_kind)
+
+                hit_kind[~active] = -1
+                contact = hit_kind >= 0
+
+                # No contact: travel the remaining distance and finish
+                free = active & ~contact
+                self.ball_x[free] += dx[free]
+                self.ball_y[free] += dy[free]
+                active &= contact
+                if not active.any():
+                    break
+
+                # Move to the contact point and resolve
+                t = t_hit[active]
+                self.ball_x[active] += dx[active] * t
+                self.ball_y[active] += dy[active] * t
+                remaining[active] *= 1.0 - t
+
+                wall = hit_kind == 0
+                self.ball_vy[wall] *= -1
+                np.clip(self.ball_y, r, self.height - r, out=self.ball_y, where=wall)
+
+                for kind, (paddle_x, paddle_y, paddle_height) in enumerate(paddles, start=1):
+                    hit = hit_kind == kind
+                    if hit.any():
+                        self._bounce_off_paddle(hit, paddle_x, paddle_y, paddle_height)
+
+                active &= remaining > 0
+
+    def _bounce_off_paddle(self, hit, paddle_x, paddle_y, paddle_height):
+        """Vectorized Ball._bounce_off_paddle() + PongGame._on_paddle_hit()"""
+        r = self.ball_radius
+
+        # Reverse horizontal direction
+        self.ball_vx[hit] *= -1
+
+        # Spin based on where the ball hits the paddle
+        half_height = paddle_height[hit] / 2
+        hit_pos = (self.ball_y[hit] - (paddle_y[hit] + half_height)) / half_height
+        vy = np.clip(self.ball_vy[hit] + hit_pos * 2, -self.max_vy, self.max_vy)
+
+        # Move ball outside paddle to prevent multiple collisions
+        vx = self.ball_vx[hit]
+        self.ball_x[hit] = np.where(vx > 0,
+                                    paddle_x + self.paddle_width + r,
+                                    paddle_x - r)
+
+        # 10% faster per hit, horizontal speed capped
+        self.ball_vx[hit] = np.clip(vx * 1.10, -self.max_vx, self.max_vx)
+        self.ball_vy[hit] = vy * 1.10
+
+        self.rally_length[hit] += 1
+
+    def _reset_ball(self, mask):
+        """Vectorized PongGame.reset_ball()"""
+        self.ball_x[mask] = self.width // 2
+        self.ball_y[mask] = self.height // 2
+
+        # Reverse direction, then reset magnitude keeping direction
+        direction_x = np.where(self.ball_vx[mask] > 0, -1.0, 1.0)
+        direction_y = np.where(self.ball_vy[mask] > 0, 1.0, -1.0)
+        self.ball_vx[mask] = self.ball_speed * direction_x
+        self.ball_vy[mask] = self.ball_speed * direction_y
+
+        self.rally_length[mask] = 0
+
+
+def _ray_box(x, y, dx, dy, left, top, right, bottom):
+    """Vectorized slab test: entry time per ray, inf on a miss"""
+    tx1 = (left - x) / dx
+    tx2 = (right - x) / dx
+    ty1 = (top - y) / dy
+    ty2 = (bottom - y) / dy
+
+    # Axis-parallel rays: inside the slab -> unbounded, outside -> miss
+    inside_x = (x >= left) & (x <= right)
+    inside_y = (y >= top) & (y <= bottom)
+    tx_min = np.where(dx == 0, np.where(inside_x, -np.inf, np.inf), np.minimum(tx1, tx2))
+    tx_max = np.where(dx == 0, np.where(inside_x, np.inf, -np.inf), np.maximum(tx1, tx2))
+    ty_min = np.where(dy == 0, np.where(inside_y, -np.inf, np.inf), np.minimum(ty1, ty2))
+    ty_max = np.where(dy == 0, np.where(inside_y, np.inf, -np.inf), np.maximum(ty1, ty2))
+
+    t_enter = np.maximum(tx_min, ty_min)
+    t_exit = np.minimum(tx_max, ty_max)
+    return np.where((t_enter <= t_exit) & (t_enter >= 0) & (t_enter <= 1), t_enter, np.inf)
+
+
+def _sweep_circle_rect(x, y, dx, dy, radius, left, top, right, bottom):
+    """Vectorized core.collision.sweep_circle_rect(), time of impact only"""
+    # Already overlapping
+    px = np.minimum(np.maximum(x, left), right)
+    py = np.minimum(np.maximum(y, top), bottom)
+    overlap = (x - px) ** 2 + (y - py) ** 2 <= radius * radius
+
+    # Flat faces
+    t = np.minimum(_ray_box(x, y, dx, dy, left - radius, top, right + radius, bottom),
+                   _ray_box(x, y, dx, dy, left, top - radius, right, bottom + radius))
+
+    # Rounded corners
+    a = dx * dx + dy * dy
+    for cx, cy in ((left, top), (right, top), (left, bottom), (right, bottom)):
+        fx = x - cx
+        fy = y - cy
+        b = fx * dx + fy * dy
+        c = fx * fx + fy * fy - radius * radius
+        disc = b * b - a * c
+        tc = (-b - np.sqrt(np.maximum(disc, 0))) / a
+        hx = x + dx * tc
+        hy = y + dy * tc
+        in_corner = ~(((hx >= left) & (hx <= right)) | ((hy >= top) & (hy <= bottom)))
+        valid = (disc >= 0) & (a > 0) & (tc >= 0) & (tc <= 1) & in_corner
+        t = np.where(valid, np.minimum(t, tc), t)
+
+    return np.where(overlap, 0.0, t)
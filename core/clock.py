@@ -0,0 +1,52 @@
+"""
+Fixed-Timestep Simulation Clock
+-------------------------------
+Decouples physics from the camera frame rate. Real elapsed time is fed
+into an accumulator which is drained in fixed dt steps; the leftover
+fraction (alpha) is used by the renderer to interpolate between the last
+two physics states.
+"""
+import time
+import config
+
+class FixedTimestepClock:
+    def __init__(self, hz=None, max_steps=None):
+        self.hz = hz or config.PHYSICS_HZ
+        self.dt = 1.0 / self.hz
+        # Cap steps per frame so a long stall can't spiral into catch-up
+        self.max_steps = max_steps or config.PHYSICS_MAX_STEPS
+        self.accumulator = 0.0
+        self.last_time = None
+        self.alpha = 1.0
+
+    def advance(self, now=None):
+        """
+        Add elapsed real time to the accumulator.
+        Returns: number of fixed physics steps to run this frame
+        """
+        if now is None:
+            now = time.perf_counter()
+
+        if self.last_time is None:
+            self.last_time = now
+        elapsed = now - self.last_time
+        self.last_time = now
+
+        self.accumulator += max(0.0, elapsed)
+
+        steps = int(self.accumulator / self.dt)
+        if steps > self.max_steps:
+            # Drop the backlog instead of fast-forwarding the game
+            steps = self.max_steps
+            self.accumulator = 0.0
+        else:
+            self.accumulator -= steps * self.dt
+
+        self.alpha = self.accumulator / self.dt
+        return steps
+
+    def reset(self):
+        """Forget accumulated time (e.g. while paused)"""
+        self.accumulator = 0.0
+        self.last_time = None
+        self.alpha = 1.0
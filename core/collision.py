@@ -0,0 +1,113 @@
+"""
+Continuous Collision Detection
+------------------------------
+Swept circle vs axis-aligned rectangle. A circle of radius r touching a
+rectangle is equivalent to its center touching the rectangle grown by r
+(a rounded rectangle), so the sweep is a ray cast against two slabs and
+four corner circles.
+"""
+import math
+
+def _ray_box(x, y, dx, dy, left, top, right, bottom):
+    """Slab test. Returns (t_enter, nx, ny) or None if the ray misses."""
+    t_enter = -math.inf
+    t_exit = math.inf
+    nx = ny = 0.0
+
+    # X slab
+    if dx == 0:
+        if x < left or x > right:
+            return None
+    else:
+        t1 = (left - x) / dx
+        t2 = (right - x) / dx
+        n = -1.0
+        if t1 > t2:
+            t1, t2 = t2, t1
+            n = 1.0
+        if t1 > t_enter:
+            t_enter, nx, ny = t1, n, 0.0
+        t_exit = min(t_exit, t2)
+
+    # Y slab
+    if dy == 0:
+        if y < top or y > bottom:
+            return None
+    else:
+        t1 = (top - y) / dy
+        t2 = (bottom - y) / dy
+        n = -1.0
+        if t1 > t2:
+            t1, t2 = t2, t1
+            n = 1.0
+        if t1 > t_enter:
+            t_enter, nx, ny = t1, 0.0, n
+        t_exit = min(t_exit, t2)
+
+    if t_enter > t_exit:
+        return None
+    return t_enter, nx, ny
+
+def _ray_circle(x, y, dx, dy, cx, cy, r):
+    """Earliest t where the ray is at distance r from (cx, cy), or None"""
+    fx = x - cx
+    fy = y - cy
+    a = dx * dx + dy * dy
+    if a == 0:
+        return None
+    b = fx * dx + fy * dy
+    c = fx * fx + fy * fy - r * r
+    disc = b * b - a * c
+    if disc < 0:
+        return None
+    return (-b - math.sqrt(disc)) / a
+
+def sweep_circle_rect(x, y, dx, dy, radius, left, top, right, bottom):
+    """
+    Sweep a circle at (x, y) along displacement (dx, dy) against a rectangle.
+
+    Returns:
+        (t, nx, ny) with t in [0, 1] the fraction of the displacement at
+        first contact and (nx, ny) the contact normal, or None if there is
+        no contact during the move. t == 0 means the circle already overlaps.
+    """
+    # Already overlapping (closest point on rect within radius)
+    px = min(max(x, left), right)
+    py = min(max(y, top), bottom)
+    ox = x - px
+    oy = y - py
+    if ox * ox + oy * oy <= radius * radius:
+        if ox == 0 and oy == 0:
+            # Center is inside: push out along the movement direction
+            return 0.0, (-1.0 if dx > 0 else 1.0), 0.0
+        d = math.sqrt(ox * ox + oy * oy)
+        return 0.0, ox / d, oy / d
+
+    if dx == 0 and dy == 0:
+        return None
+
+    best = None
+
+    # Flat faces: rect grown by r along one axis only
+    hit = _ray_box(x, y, dx, dy, left - radius, top, right + radius, bottom)
+    if hit is not None and 0 <= hit[0] <= 1:
+        best = hit
+    hit = _ray_box(x, y, dx, dy, left, top - radius, right, bottom + radius)
+    if hit is not None and 0 <= hit[0] <= 1 and (best is None or hit[0] < best[0]):
+        best = hit
+
+    # Rounded corners
+    for cx, cy in ((left, top), (right, top), (left, bottom), (right, bottom)):
+        t = _ray_circle(x, y, dx, dy, cx, cy, radius)
+        if t is None or t < 0 or t > 1:
+            continue
+        if best is not None and t >= best[0]:
+            continue
+        hx = x + dx * t
+        hy = y + dy * t
+        # Only the quarter-circle outside both faces belongs to the corner
+        if left <= hx <= right or top <= hy <= bottom:
+            continue
+        best = (t, (hx - cx) / radius, (hy - cy) / radius)
+
+    return best
@@ -0,0 +1,212 @@
+"""
+Display Thread
+--------------
+Moves drawing, cv2.imshow and cv2.waitKey off the vision/physics loop.
+
+The game loop publishes a snapshot per tick: a copy of the camera frame plus
+copies of the scalar state of every body, so the live game objects can keep
+changing while an older tick is being drawn. Snapshots live in preallocated
+slots: the loop fills the back buffer and swaps it with the pending slot, the
+display thread swaps the pending slot with its front buffer. Neither side
+waits on the other; a tick the display didn't get to is simply replaced.
+
+Key presses go back to the game loop through a deque (append/popleft are
+atomic in CPython, so no lock is needed).
+"""
+import copy
+import threading
+from collections import deque
+import cv2
+import numpy as np
+import config
+from core.game import GameStateView
+
+
+class RenderSnapshot:
+    """Everything the display needs to draw one tick, owned by one buffer slot"""
+    def __init__(self):
+        self.frame = None
+        self.state = GameStateView()
+        self.hand_results = None
+        self.finger_pos = None
+        self.fps = 0
+        self.recording = None  # sample count while recording, else None
+        self.paused = False
+        self.seq = 0
+
+        # Shadow copies of the live bodies, refreshed in place
+        self._bodies = {}
+        # Power-up shadows: a pool that only grows, and the list handed to the
+        # renderer, trimmed/extended to the live count
+        self._powerup_pool = []
+        self._powerups = []
+
+    def _copy_body(self, name, body):
+        shadow = self._bodies.get(name)
+        if shadow is None or type(shadow) is not type(body):
+            shadow = self._bodies[name] = copy.copy(body)
+        else:
+            shadow.__dict__.update(body.__dict__)
+        return shadow
+
+    def _copy_powerups(self, powerups):
+        pool = self._powerup_pool
+        shadows = self._powerups
+        for i, pu in enumerate(powerups):
+            if i == len(pool):
+                pool.append(copy.copy(pu))
+            elif type(pool[i]) is not type(pu):
+                pool[i] = copy.copy(pu)
+                if i < len(shadows):
+                    shadows[i] = pool[i]
+            else:
+                pool[i].__dict__.update(pu.__dict__)
+
+        count = len(powerups)
+        del shadows[count:]
+        shadows.extend(pool[len(shadows):count])
+        return shadows
+
+    def fill(self, frame, game_state, hand_results, finger_pos, fps, recording, paused, seq):
+        if self.frame is None or self.frame.shape != frame.shape:
+            self.frame = np.empty_like(frame)
+        np.copyto(self.frame, frame)
+
+        state = self.state
+        for name in GameStateView.__slots__:
+            setattr(state, name, getattr(game_state, name))
+        state.player_paddle = self._copy_body('player_paddle', game_state.player_paddle)
+        state.ai_paddle = self._copy_body('ai_paddle', game_state.ai_paddle)
+        state.ball = self._copy_body('ball', game_state.ball)
+        if game_state.powerups is not None:
+            state.powerups = self._copy_powerups(game_state.powerups)
+        if game_state.active_effects is not None:
+            state.active_effects = {effect: dict(data) for effect, data in game_state.active_effects.items()}
+
+        # MediaPipe returns a new results object per frame, so a reference is enough
+        self.hand_results = hand_results
+        self.finger_pos = finger_pos
+        self.fps = fps
+        self.recording = recording
+        self.paused = paused
+        self.seq = seq
+
+
+class DisplayThread:
+    def __init__(self, renderer, hand_tracker, window_name, threaded=None):
+        """
+        Args:
+            renderer: GameRenderer
+            hand_tracker: HandTracker (used for landmark drawing only)
+            window_name: cv2 window to present into
+            threaded: draw on a separate thread (default config.DISPLAY_THREAD).
+                      When False, publish() draws and presents immediately.
+        """
+        self.renderer = renderer
+        self.hand_tracker = hand_tracker
+        self.window_name = window_name
+        self.threaded = config.DISPLAY_THREAD if threaded is None else threaded
+
+        # Back buffer (game loop), pending slot, front buffer (display thread)
+        self.back = RenderSnapshot()
+        self.pending = RenderSnapshot()
+        self.front = RenderSnapshot()
+        self.swap_lock = threading.Lock()
+        self.has_pending = False
+        self.new_frame = threading.Event()
+        self.seq = 0
+
+        self.keys = deque()
+        self.running = False
+        self.thread = None
+        self.frames_presented = 0
+
+    def start(self):
+        """Create the window (on the thread that will use it) and start presenting"""
+        self.running = True
+        if self.threaded:
+            self.thread = threading.Thread(target=self._run, name="display", daemon=True)
+            self.thread.start()
+        else:
+            cv2.namedWindow(self.window_name, cv2.WINDOW_NORMAL)
+
+    def publish(self, frame, game_state, hand_results=None, finger_pos=None,
+                fps=0, recording=None, paused=False):
+        """Hand a finished tick to the display. Never blocks on drawing."""
+        self.seq += 1
+        self.back.fill(frame, game_state, hand_results, finger_pos, fps, recording, paused, self.seq)
+
+        if not self.threaded:
+            self._present(self.back)
+            return
+
+        with self.swap_lock:
+            self.back, self.pending = self.pending, self.back
+            self.has_pending = True
+        self.new_frame.set()
+
+    def idle(self):
+        """Keep the window responsive while no tick is published (e.g. waiting for the camera)"""
+        if self.running and not self.threaded:
+            self._poll_window()
+
+    def poll_keys(self):
+        """Key codes pressed since the last call (oldest first)"""
+        keys = []
+        while self.keys:
+            keys.append(self.keys.popleft())
+        return keys
+
+    def stop(self):
+        self.running = False
+        self.new_frame.set()
+        if self.thread is not None:
+            self.thread.join(timeout=1.0)
+            self.thread = None
+
+    def _run(self):
+        cv2.namedWindow(self.window_name, cv2.WINDOW_NORMAL)
+        while self.running:
+            # Wait for a new tick, but keep pumping GUI events meanwhile
+            if self.new_frame.wait(timeout=1.0 / config.FPS_TARGET):
+                self.new_frame.clear()
+                with self.swap_lock:
+                    if self.has_pending:
+                        self.front, self.pending = self.pending, self.front
+                        self.has_pending = False
+                        ready = True
+                    else:
+                        ready = False
+                if ready:
+                    self._present(self.front)
+                    continue
+            self._poll_window()
+        cv2.destroyWindow(self.window_name)
+
+    def _present(self, snapshot):
+        """Draw a snapshot onto its own frame copy and show it"""
+        frame = self.renderer.render(snapshot.frame, snapshot.state)
+
+        # Draw hand landmarks
+        frame = self.hand_tracker.draw_landmarks(frame, snapshot.hand_results)
+        frame = self.hand_tracker.draw_finger_indicator(frame, snapshot.finger_pos)
+
+        # Draw FPS
+        self.renderer.draw_fps(frame, snapshot.fps)
+
+        # Draw Recording Status
+        if snapshot.recording is not None:
+            self.renderer.draw_recording(frame, snapshot.recording)
+
+        # Draw pause overlay if paused
+        if snapshot.paused:
+            frame = self.renderer.draw_pause_overlay(frame)
+
+        cv2.imshow(self.window_name, frame)
+        self.frames_presented += 1
+        self._poll_window()
+
+    def _poll_window(self):
+        key = cv2.waitKey(1) & 0xFF
+        if key != 0xFF:
+            self.keys.append(key)
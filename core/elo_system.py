@@ -23,7 +23,7 @@ class EloSystem:
         
     def load_rating(self):
         """Load rating from file"""
-        if os.path.exists(self.save_file):
+        if self.save_file and os.path.exists(self.save_file):
             try:
                 with open(self.save_file, 'r') as f:
                     data = json.load(f)
@@ -33,7 +33,9 @@ class EloSystem:
                 print(f"Error loading rating: {e}")
                 
     def save_rating(self):
-        """Save rating to file"""
+        """Save rating to file (no-op when save_file is None, e.g. replays)"""
+        if not self.save_file:
+            return
         try:
             os.makedirs(os.path.dirname(self.save_file), exist_ok=True)
             with open(self.save_file, 'w') as f:
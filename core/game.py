@@ -6,6 +6,58 @@ from core.ball import Ball
 from core.paddle import Paddle
 import config
 
+class GameStateView:
+    """
+    Preallocated game state snapshot, refreshed in place once per tick.
+    Replaces the per-frame state dict; consumers read attributes directly.
+    Dict-style access (state['ball']) is kept for older callers.
+    """
+    __slots__ = (
+        # Core game state (refreshed by PongGame)
+        'frame_count', 'player_paddle', 'ai_paddle', 'ball',
+        'player_score', 'ai_score', 'current_rally_length', 'rally_ended',
+        'ball_direction_changed', 'time_since_direction_change', 'status',
+        'width', 'height',
+        # Presentation extras (filled in by the game loop)
+        'alpha', 'predicted_y', 'player_rating', 'emotion', 'frustration',
+        'powerups', 'active_effects', 'now'
+    )
+    
+    def __init__(self):
+        for name in self.__slots__:
+            setattr(self, name, None)
+        self.alpha = 1.0
+    
+    def refresh(self, game):
+        """Copy current values from a PongGame (no allocation)"""
+        self.frame_count = game.frame_count
+        self.player_paddle = game.player_paddle
+        self.ai_paddle = game.ai_paddle
+        self.ball = game.ball
+        self.player_score = game.player_score
+        self.ai_score = game.ai_score
+        self.current_rally_length = game.current_rally_length
+        self.rally_ended = game.rally_ended
+        self.ball_direction_changed = game.ball_direction_changed
+        self.time_since_direction_change = game.time_since_direction_change
+        self.status = 'paused' if game.is_paused else 'playing'
+        self.width = game.width
+        self.height = game.height
+        return self
+    
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key)
+    
+    def __contains__(self, key):
+        return key in self.__slots__ and getattr(self, key) is not None
+    
+    def get(self, key, default=None):
+        value = getattr(self, key, None)
+        return default if value is None else value
+
 class PongGame:
     def __init__(self, width=None, height=None):
         self.width = width or config.SCREEN_WIDTH
@@ -36,9 +88,15 @@ class PongGame:
         self.ball_direction_changed = False
         self.time_since_direction_change = 0
         self.last_ball_vx = self.ball.vx
+        
+        # Reused state snapshot (see get_state)
+        self.state = GameStateView()
     
-    def update(self):
-        """Update game state"""
+    def update(self, dt=None):
+        """
+        Advance game state by one physics step.
+        dt: step length in seconds (defaults to one 1 / FPS_TARGET frame)
+        """
         if self.is_paused:
             return
         
@@ -51,25 +109,20 @@ class PongGame:
             self.ball_direction_changed = True
             self.time_since_direction_change = 0
         else:
-            self.time_since_direction_change += 1 / config.FPS_TARGET
+            self.time_since_direction_change += dt if dt is not None else 1 / config.FPS_TARGET
         
         self.last_ball_vx = self.ball.vx
         
-        # Update paddles
-        self.player_paddle.update(self.height)
-        self.ai_paddle.update(self.height)
-        
-        # Check paddle collisions
-        if self.ball.check_paddle_collision(self.player_paddle):
-            self.current_rally_length += 1
-            self.ball.increase_speed(1.10) # 10% faster per hit (was 5%)
+        self.ball.store_position()
         
-        if self.ball.check_paddle_collision(self.ai_paddle):
-            self.current_rally_length += 1
-            self.ball.increase_speed(1.10) # 10% faster per hit
+        # Update paddles
+        self.player_paddle.update(self.height, dt)
+        self.ai_paddle.update(self.height, dt)
         
-        # Update ball and check scoring
-        result = self.ball.update(self.width, self.height)
+        # Move ball with swept collision against walls and paddles
+        result = self.ball.advance(self.width, self.height,
+                                   (self.player_paddle, self.ai_paddle),
+                                   dt, self._on_paddle_hit)
         
         if result == 'left_scores':
             self.player_score += 1
@@ -84,6 +137,11 @@ class PongGame:
             
         return None
     
+    def _on_paddle_hit(self, paddle):
+        """Rally bookkeeping after a paddle bounce"""
+        self.current_rally_length += 1
+        self.ball.increase_speed(1.10) # 10% faster per hit (was 5%)
+    
     def reset_ball(self):
         """Reset ball to center and end rally"""
         self.ball.reset(self.width // 2, self.height // 2)
@@ -103,6 +161,8 @@ class PongGame:
         self.ball.reset(self.width // 2, self.height // 2)
         self.player_paddle.y = self.height // 2 - 40
         self.ai_paddle.y = self.height // 2 - 40
+        self.player_paddle.last_y = self.player_paddle.y
+        self.ai_paddle.last_y = self.ai_paddle.y
         self.game_start_time = time.time()
 
     def set_ai_parameters(self, params):
@@ -112,19 +172,8 @@ class PongGame:
         self.ai_reaction_delay = params['reaction_delay']
     
     def get_state(self):
-        """Get current game state for ML/data collection"""
-        return {
-            'frame_count': self.frame_count,
-            'player_paddle': self.player_paddle,
-            'ai_paddle': self.ai_paddle,
-            'ball': self.ball,
-            'player_score': self.player_score,
-            'ai_score': self.ai_score,
-            'current_rally_length': self.current_rally_length,
-            'rally_ended': self.rally_ended,
-            'ball_direction_changed': self.ball_direction_changed,
-            'time_since_direction_change': self.time_since_direction_change,
-            'status': 'paused' if self.is_paused else 'playing',
-            'width': self.width,
-            'height': self.height
-        }
+        """
+        Get current game state for ML/data collection.
+        Refreshes and returns the shared GameStateView - call once per tick.
+        """
+        return self.state.refresh(self)
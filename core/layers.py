@@ -0,0 +1,91 @@
+"""
+Cached Render Layers
+--------------------
+A layer is drawn once with regular cv2 calls and only redrawn when its key
+(e.g. rating, score) changes. After drawing, the layer is cropped to the
+pixels actually used, so compositing it onto the camera image every frame
+only touches that dirty rectangle.
+
+Transparency is recovered by drawing the layer twice, over black and over
+white: the black render is the premultiplied color and white - black is
+(1 - alpha) per channel. This stays exact for anti-aliased text and
+overlapping shapes. Compositing is frame = frame * (1 - alpha) + color.
+"""
+import cv2
+import numpy as np
+
+_UNSET = object()
+
+class CachedLayer:
+    def __init__(self, width, height, draw_fn):
+        """
+        Args:
+            width, height: size of the target frame
+            draw_fn: callable(canvas, key) drawing into a BGR canvas
+        """
+        self.width = width
+        self.height = height
+        self.draw_fn = draw_fn
+        self.on_black = np.zeros((height, width, 3), dtype=np.uint8)
+        self.on_white = np.zeros((height, width, 3), dtype=np.uint8)
+        self.key = _UNSET
+        self.render_count = 0
+
+        # Cropped content, set by _crop()
+        self.rect = None         # (x, y, w, h) in frame coordinates
+        self.color = None        # premultiplied color
+        self.mask = None         # uint8 coverage mask (used when fully opaque)
+        self.inv_alpha = None    # 255 - alpha per channel, None if fully opaque
+
+    def update(self, key):
+        """Redraw if key changed. Returns True if the layer was redrawn."""
+        if key == self.key:
+            return False
+        self.key = key
+        self.on_black.fill(0)
+        self.on_white.fill(255)
+        self.draw_fn(self.on_black, key)
+        self.draw_fn(self.on_white, key)
+        self._crop()
+        self.render_count += 1
+        return True
+
+    def invalidate(self):
+        """Force a redraw on the next update()"""
+        self.key = _UNSET
+
+    def _crop(self):
+        """Shrink the layer to the bounding box of its non-transparent pixels"""
+        inv_alpha = cv2.subtract(self.on_white, self.on_black)
+        covered = (inv_alpha != 255).any(axis=2)
+        rows = np.flatnonzero(covered.any(axis=1))
+        if rows.size == 0:
+            self.rect = None
+            return
+        cols = np.flatnonzero(covered.any(axis=0))
+        y0, y1 = rows[0], rows[-1] + 1
+        x0, x1 = cols[0], cols[-1] + 1
+
+        self.rect = (int(x0), int(y0), int(x1 - x0), int(y1 - y0))
+        self.color = np.ascontiguousarray(self.on_black[y0:y1, x0:x1])
+        inv_alpha = np.ascontiguousarray(inv_alpha[y0:y1, x0:x1])
+        if ((inv_alpha == 0) | (inv_alpha == 255)).all():
+            # Hard-edged content: a masked copy is enough
+            self.mask = covered[y0:y1, x0:x1].astype(np.uint8)
+            self.inv_alpha = None
+        else:
+            self.mask = None
+            self.inv_alpha = inv_alpha
+
+    def composite(self, frame):
+        """Draw the layer over frame in place, touching only its rectangle"""
+        if self.rect is None:
+            return frame
+        x, y, w, h = self.rect
+        roi = frame[y:y + h, x:x + w]
+        if self.inv_alpha is None:
+            cv2.copyTo(self.color, self.mask, roi)
+        else:
+            cv2.multiply(roi, self.inv_alpha, dst=roi, scale=1 / 255)
+            cv2.add(roi, self.color, dst=roi)
+        return frame
@@ -0,0 +1,83 @@
+"""
+Offscreen Renderer
+------------------
+Runs GameRenderer without a window (no cv2.imshow), for servers, benchmarks
+and replay review. Each frame starts from a background that stands in for
+the camera image:
+
+    None                      synthetic: dark vertical gradient
+    image file (.png, .jpg)   a fixed still image
+    video file                frames from a recording, looped
+"""
+import os
+import cv2
+import numpy as np
+from core.renderer import GameRenderer
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp')
+
+class OffscreenRenderer:
+    def __init__(self, width, height, background=None, renderer=None):
+        self.width = width
+        self.height = height
+        self.renderer = renderer or GameRenderer()
+        self.frame = np.empty((height, width, 3), dtype=np.uint8)
+
+        self.capture = None
+        self.still = None
+        if background is None:
+            self.still = _gradient(width, height)
+        elif os.path.splitext(background)[1].lower() in IMAGE_EXTENSIONS:
+            image = cv2.imread(background)
+            if image is None:
+                raise RuntimeError(f"Failed to read background image {background}")
+            self.still = cv2.resize(image, (width, height))
+        else:
+            self.capture = cv2.VideoCapture(background)
+            if not self.capture.isOpened():
+                raise RuntimeError(f"Failed to open background video {background}")
+
+    def _fill_background(self):
+        if self.still is not None:
+            np.copyto(self.frame, self.still)
+            return
+        ok, image = self.capture.read()
+        if not ok:
+            # Loop the recording
+            self.capture.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            ok, image = self.capture.read()
+            if not ok:
+                self.frame.fill(0)
+                return
+        if image.shape[:2] != (self.height, self.width):
+            cv2.resize(image, (self.width, self.height), dst=self.frame)
+        else:
+            np.copyto(self.frame, image)
+
+    def render(self, game_state, fps=None):
+        """
+        Draw one frame of game_state (GameStateView) over the background.
+        Returns the internal frame buffer, overwritten by the next call.
+        """
+        self._fill_background()
+        self.renderer.render(self.frame, game_state)
+        if fps is not None:
+            self.renderer.draw_fps(self.frame, fps)
+        if game_state.status == 'paused':
+            self.renderer.draw_pause_overlay(self.frame)
+        return self.frame
+
+    def release(self):
+        if self.capture is not None:
+            self.capture.release()
+            self.capture = None
+
+
+def _gradient(width, height):
+    """Dark blue-grey vertical gradient (synthetic camera background)"""
+    ramp = np.linspace(20, 60, height, dtype=np.float32)[:, None]
+    frame = np.empty((height, width, 3), dtype=np.uint8)
+    frame[:, :, 0] = ramp + 10
+    frame[:, :, 1] = ramp
+    frame[:, :, 2] = ramp * 0.8
+    return frame
@@ -13,17 +13,26 @@ class Paddle:
         self.target_y = y
         self.is_player = is_player
         self.prev_y = y  # For velocity calculation
+        self.last_y = y  # Position at the start of the last physics step
     
-    def update(self, screen_height):
-        """Smooth movement to target position with bounds checking"""
+    def update(self, screen_height, dt=None):
+        """
+        Smooth movement to target position with bounds checking.
+        dt is in seconds; easing is defined per reference frame (1 / FPS_TARGET).
+        """
+        self.last_y = self.y
+        
         # Bounds checking for target
         self.target_y = max(0, min(self.target_y, screen_height - self.height))
         
         # Smooth interpolation to target
         diff = self.target_y - self.y
         if abs(diff) > 1:
-            # Smooth movement (30% of difference per frame)
-            self.y += diff * 0.3
+            # Smooth movement (30% of difference per reference frame)
+            if dt is None:
+                self.y += diff * 0.3
+            else:
+                self.y += diff * (1.0 - 0.7 ** (dt * config.FPS_TARGET))
         else:
             self.y = self.target_y
         
@@ -52,6 +61,10 @@ class Paddle:
         self.prev_y = self.y
         return velocity
     
+    def render_y(self, alpha):
+        """Y position interpolated between the last two physics steps"""
+        return self.last_y + (self.y - self.last_y) * alpha
+    
     def get_center_y(self):
         """Get center Y position of paddle"""
         return self.y + self.height / 2
@@ -13,14 +13,22 @@ TYPE_BIG_PADDLE = 'big_paddle'
 TYPE_FAST_BALL = 'fast_ball' # Replaces slow_motion
 TYPE_SHRINK_AI = 'shrink_ai'
 
+POWERUP_RADIUS = 15
+GRID_CELL_SIZE = 64 # px, larger than ball + power-up radius
+
 class PowerUp:
-    def __init__(self, x, y, type):
+    def __init__(self, x, y, type, spawn_time=None):
         self.x = x
         self.y = y
         self.type = type
-        self.radius = 15
+        self.radius = POWERUP_RADIUS
         self.active = True
-        self.spawn_time = time.time()
+        
+        # Storage bookkeeping (see PowerUpManager / PowerUpGrid)
+        self.index = -1
+        self.cell = None
+        self.cell_index = -1
+        self.spawn_time = spawn_time if spawn_time is not None else time.time()
         
         # Visuals
         if self.type == TYPE_BIG_PADDLE:
@@ -33,18 +41,69 @@ class PowerUp:
             self.color = (0, 0, 255) # Red
             self.symbol = "-"
 
+class PowerUpGrid:
+    """
+    Uniform spatial hash of power-ups keyed by (col, row) cell.
+    A collision query only visits the cells under the ball, so its cost
+    doesn't grow with the number of items on the field.
+    """
+    def __init__(self, cell_size=GRID_CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells = {}
+    
+    def insert(self, powerup):
+        key = (int(powerup.x // self.cell_size), int(powerup.y // self.cell_size))
+        bucket = self.cells.get(key)
+        if bucket is None:
+            bucket = self.cells[key] = []
+        powerup.cell = key
+        powerup.cell_index = len(bucket)
+        bucket.append(powerup)
+    
+    def remove(self, powerup):
+        """Swap-remove from its cell (O(1))"""
+        bucket = self.cells[powerup.cell]
+        last = bucket.pop()
+        if last is not powerup:
+            bucket[powerup.cell_index] = last
+            last.cell_index = powerup.cell_index
+        elif not bucket:
+            del self.cells[powerup.cell]
+        powerup.cell = None
+        powerup.cell_index = -1
+    
+    def query(self, x, y, reach):
+        """Power-ups in cells overlapping the square of half-size reach around (x, y)"""
+        size = self.cell_size
+        found = []
+        for col in range(int((x - reach) // size), int((x + reach) // size) + 1):
+            for row in range(int((y - reach) // size), int((y + reach) // size) + 1):
+                bucket = self.cells.get((col, row))
+                if bucket:
+                    found.extend(bucket)
+        return found
+
 class PowerUpManager:
-    def __init__(self, game):
+    def __init__(self, game, rng=None, start_time=None):
         self.game = game
+        # Own RNG so sessions can be seeded and replayed
+        self.rng = rng or random.Random()
+        # Items on the field: flat list (swap-remove) for drawing + grid for collisions
         self.powerups = []
+        self.grid = PowerUpGrid()
         # active_effects: type -> {'end_time': float, 'stack': int}
         self.active_effects = {} 
-        self.last_spawn_time = time.time()
+        self.current_time = start_time if start_time is not None else time.time()
+        self.last_spawn_time = self.current_time
         self.spawn_interval = 5.0 # Seconds (was 10.0)
         
-    def update(self, emotion="Neutral"):
-        """Update power-ups and spawn new ones"""
-        current_time = time.time()
+    def update(self, emotion="Neutral", now=None):
+        """
+        Update power-ups and spawn new ones.
+        now: wall-clock time in seconds (defaults to time.time(), replays pass recorded time)
+        """
+        current_time = now if now is not None else time.time()
+        self.current_time = current_time
         
         # 1. Spawning Logic
         # Happy players get more power-ups
@@ -58,14 +117,17 @@ class PowerUpManager:
             self._spawn_random_powerup()
             self.last_spawn_time = current_time
             
-        # 2. Check Collisions
+        # 2. Check Collisions (only items in nearby grid cells)
         ball = self.game.ball
-        for pu in self.powerups[:]:
-            # Simple Circle Collision
-            dist = ((ball.x - pu.x)**2 + (ball.y - pu.y)**2)**0.5
-            if dist < (ball.radius + pu.radius):
+        reach = ball.radius + POWERUP_RADIUS
+        for pu in self.grid.query(ball.x, ball.y, reach):
+            # Circle collision, squared distances
+            dx = ball.x - pu.x
+            dy = ball.y - pu.y
+            min_dist = ball.radius + pu.radius
+            if dx * dx + dy * dy < min_dist * min_dist:
                 self._activate_powerup(pu)
-                self.powerups.remove(pu)
+                self._remove_powerup(pu)
                 
         # 3. Update Active Effects
         expired_effects = []
@@ -80,19 +142,34 @@ class PowerUpManager:
     def _spawn_random_powerup(self):
         """Spawn a power-up in the middle area"""
         margin = 100
-        x = random.randint(margin, config.SCREEN_WIDTH - margin)
-        y = random.randint(margin, config.SCREEN_HEIGHT - margin)
+        x = self.rng.randint(margin, config.SCREEN_WIDTH - margin)
+        y = self.rng.randint(margin, config.SCREEN_HEIGHT - margin)
         
         types = [TYPE_BIG_PADDLE, TYPE_FAST_BALL, TYPE_SHRINK_AI]
-        chosen_type = random.choice(types)
+        chosen_type = self.rng.choice(types)
         
-        self.powerups.append(PowerUp(x, y, chosen_type))
+        self._add_powerup(PowerUp(x, y, chosen_type, self.current_time))
         print(f"Spawned PowerUp: {chosen_type}")
+    
+    def _add_powerup(self, powerup):
+        powerup.index = len(self.powerups)
+        self.powerups.append(powerup)
+        self.grid.insert(powerup)
+    
+    def _remove_powerup(self, powerup):
+        """Swap-remove from the field list and the grid (O(1))"""
+        last = self.powerups.pop()
+        if last is not powerup:
+            self.powerups[powerup.index] = last
+            last.index = powerup.index
+        powerup.index = -1
+        powerup.active = False
+        self.grid.remove(powerup)
         
     def _activate_powerup(self, powerup):
         """Apply effect with Stacking"""
         duration = 10.0 
-        current_time = time.time()
+        current_time = self.current_time
         
         # Check if already active
         if powerup.type in self.active_effects:
@@ -4,48 +4,99 @@ Renderer for overlaying game on camera feed
 import cv2
 import config
 import time
+from core.layers import CachedLayer
+from core.text_cache import TextSpriteCache
+
+def blend_rect(frame, pt1, pt2, color, opacity):
+    """
+    Alpha-blend a filled rectangle onto frame in place.
+    Only the (clipped) rectangle is touched, so the cost scales with its
+    area instead of the frame size: roi = roi * (1 - opacity) + color * opacity
+    """
+    height, width = frame.shape[:2]
+    x0, y0 = max(int(pt1[0]), 0), max(int(pt1[1]), 0)
+    x1, y1 = min(int(pt2[0]), width), min(int(pt2[1]), height)
+    if x0 >= x1 or y0 >= y1:
+        return frame
+    
+    roi = frame[y0:y1, x0:x1]
+    cv2.multiply(roi, (1.0 - opacity,) * 3, dst=roi)
+    if any(color):
+        cv2.add(roi, tuple(c * opacity for c in color), dst=roi)
+    return frame
 
 class GameRenderer:
     def __init__(self):
         self.font_large = cv2.FONT_HERSHEY_SIMPLEX
         self.font_small = cv2.FONT_HERSHEY_SIMPLEX
+        
+        # Pre-rendered text sprites (score, FPS, ELO, timers, ...)
+        self.text = TextSpriteCache()
+        
+        # Static HUD layers, redrawn only when their key changes
+        self.layers = {}
+        self.layer_shape = None
+    
+    def _layer(self, name, frame, key, draw_fn):
+        """Update (if key changed) and composite a cached layer"""
+        if self.layer_shape != frame.shape[:2]:
+            # Frame size changed: drop all cached layers
+            self.layers = {}
+            self.layer_shape = frame.shape[:2]
+        layer = self.layers.get(name)
+        if layer is None:
+            layer = self.layers[name] = CachedLayer(frame.shape[1], frame.shape[0], draw_fn)
+        layer.update(key)
+        layer.composite(frame)
     
     def render(self, frame, game_state):
-        """Render game elements on camera frame"""
+        """Render game elements on camera frame (game_state: GameStateView)"""
         # 1. Draw UI Elements (Background Layer)
         # Draw ELO Rating
-        if 'player_rating' in game_state:
-            self._draw_elo(frame, game_state['player_rating'])
+        if game_state.player_rating is not None:
+            self._layer('elo', frame, int(game_state.player_rating), self._draw_elo)
             
-        # Draw Emotion
-        if 'emotion' in game_state:
-            self._draw_emotion(frame, game_state['emotion'], game_state['frustration'])
+        # Draw Emotion (frustration bar quantized to whole pixels)
+        if game_state.frustration is not None:
+            fill = int(self.FRUSTRATION_BAR_WIDTH * game_state.frustration)
+            self._layer('emotion', frame, (game_state.emotion, fill),
+                        lambda canvas, key: self._draw_emotion(canvas, *key))
             
-        # Draw Active Power-Up HUD
-        if 'active_effects' in game_state:
-            self.draw_active_powerups(frame, game_state['active_effects'])
+        # Draw Active Power-Up HUD (changes once per second at most)
+        if game_state.active_effects is not None:
+            now = game_state.now if game_state.now is not None else time.time()
+            effects = game_state.active_effects
+            key = tuple((effect, data['stack'], int(data['end_time'] - now))
+                        for effect, data in effects.items())
+            self._layer('powerup_hud', frame, key,
+                        lambda canvas, key: self._draw_powerup_hud(canvas, key))
 
         # 2. Draw Power-Up Items (Middle Layer)
-        if 'powerups' in game_state:
-            self._draw_powerup_items(frame, game_state['powerups'])
+        if game_state.powerups is not None:
+            self._draw_powerup_items(frame, game_state.powerups)
 
         # 3. Draw Game Elements (Foreground Layer)
         # Draw center line
-        self._draw_center_line(frame, game_state['width'], game_state['height'])
+        self._layer('center_line', frame, (game_state.width, game_state.height),
+                    lambda canvas, key: self._draw_center_line(canvas, *key))
+        
+        # Interpolation factor between the last two physics steps
+        alpha = game_state.alpha
         
         # Draw paddles
-        self._draw_paddle(frame, game_state['player_paddle'], config.COLOR_GREEN)
-        self._draw_paddle(frame, game_state['ai_paddle'], config.COLOR_RED)
+        self._draw_paddle(frame, game_state.player_paddle, config.COLOR_GREEN, alpha)
+        self._draw_paddle(frame, game_state.ai_paddle, config.COLOR_RED, alpha)
         
         # Draw Ghost Paddle (Prediction)
-        if 'predicted_y' in game_state:
-            self._draw_ghost_paddle(frame, game_state['player_paddle'].x, game_state['predicted_y'])
+        if game_state.predicted_y is not None:
+            self._draw_ghost_paddle(frame, game_state.player_paddle.x, game_state.predicted_y)
         
         # Draw ball (On top of everything!)
-        self._draw_ball(frame, game_state['ball'])
+        self._draw_ball(frame, game_state.ball, alpha)
         
         # Draw score
-        self._draw_score(frame, game_state['player_score'], game_state['ai_score'])
+        self._layer('score', frame, (game_state.player_score, game_state.ai_score),
+                    lambda canvas, key: self._draw_score(canvas, *key))
         
         return frame
 
@@ -54,8 +105,8 @@ class GameRenderer:
         for pu in powerups:
             cv2.circle(frame, (int(pu.x), int(pu.y)), pu.radius, pu.color, -1)
             cv2.circle(frame, (int(pu.x), int(pu.y)), pu.radius, (255,255,255), 1)
-            cv2.putText(frame, pu.symbol, (int(pu.x)-5, int(pu.y)+5), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255,255,255), 2)
+            self.text.put_text(frame, pu.symbol, (int(pu.x)-5, int(pu.y)+5), 
+                               cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255,255,255), 2)
     
     def _draw_center_line(self, frame, width, height):
         """Draw dashed center line"""
@@ -69,36 +120,34 @@ class GameRenderer:
                     config.COLOR_WHITE, 2)
             y += dash_length + gap_length
     
-    def _draw_paddle(self, frame, paddle, color):
+    def _draw_paddle(self, frame, paddle, color, alpha=1.0):
         """Draw paddle rectangle"""
+        y = paddle.render_y(alpha)
         cv2.rectangle(frame, 
-                     (int(paddle.x), int(paddle.y)),
-                     (int(paddle.x + paddle.width), int(paddle.y + paddle.height)),
+                     (int(paddle.x), int(y)),
+                     (int(paddle.x + paddle.width), int(y + paddle.height)),
                      color, -1)
 
     def _draw_ghost_paddle(self, frame, x, y):
         """Draw semi-transparent ghost paddle at predicted position"""
-        overlay = frame.copy()
-        cv2.rectangle(overlay, 
-                     (int(x), int(y)),
-                     (int(x + config.PADDLE_WIDTH), int(y + config.PADDLE_HEIGHT)),
-                     config.COLOR_CYAN, -1)
-        cv2.addWeighted(overlay, 0.5, frame, 0.5, 0, frame)
+        blend_rect(frame, (x, y), (x + config.PADDLE_WIDTH + 1, y + config.PADDLE_HEIGHT + 1),
+                   config.COLOR_CYAN, 0.5)
     
-    def _draw_ball(self, frame, ball):
+    def _draw_ball(self, frame, ball, alpha=1.0):
         """Draw ball circle"""
-        cv2.circle(frame, (int(ball.x), int(ball.y)), ball.radius, 
+        x, y = ball.render_position(alpha)
+        cv2.circle(frame, (int(x), int(y)), ball.radius, 
                   config.COLOR_WHITE, -1)
     
     def _draw_score(self, frame, player_score, ai_score):
         """Draw score at top center"""
         score_text = f"{player_score}  -  {ai_score}"
-        text_size = cv2.getTextSize(score_text, self.font_large, 1, 2)[0]
-        text_x = (frame.shape[1] - text_size[0]) // 2
+        text_width = self.text.text_width(score_text, self.font_large, 1, config.COLOR_WHITE, 2)
+        text_x = (frame.shape[1] - text_width) // 2
         text_y = 50
         
-        cv2.putText(frame, score_text, (text_x, text_y), 
-                   self.font_large, 1, config.COLOR_WHITE, 2)
+        self.text.put_text(frame, score_text, (text_x, text_y), 
+                           self.font_large, 1, config.COLOR_WHITE, 2)
 
     def _draw_elo(self, frame, rating):
         """Draw player ELO rating with Skill Meter"""
@@ -123,11 +172,13 @@ class GameRenderer:
         cv2.rectangle(frame, (bar_x, bar_y), (bar_x + bar_w, bar_y + bar_h), (200, 200, 200), 1)
         
         text = f"ELO: {int(rating)}"
-        cv2.putText(frame, text, (bar_x, bar_y - 10), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, color, 2)
+        self.text.put_text(frame, text, (bar_x, bar_y - 10), 
+                           cv2.FONT_HERSHEY_SIMPLEX, 0.6, color, 2)
                    
-    def _draw_emotion(self, frame, emotion, frustration):
-        """Draw procedural emoji"""
+    FRUSTRATION_BAR_WIDTH = 60
+    
+    def _draw_emotion(self, frame, emotion, frustration_fill):
+        """Draw procedural emoji (frustration_fill: bar fill in pixels)"""
         x = 60
         y = config.SCREEN_HEIGHT - 100
         radius = 30
@@ -162,22 +213,27 @@ class GameRenderer:
             cv2.line(frame, (x-10, y+10), (x+10, y+10), eye_color, 2)
             
         # Frustration Bar (Mini)
-        bar_w = 60
+        bar_w = self.FRUSTRATION_BAR_WIDTH
         bar_h = 5
         bar_x = x - 30
         bar_y = y + 40
         cv2.rectangle(frame, (bar_x, bar_y), (bar_x + bar_w, bar_y + bar_h), (50,50,50), -1)
-        cv2.rectangle(frame, (bar_x, bar_y), (bar_x + int(bar_w * frustration), bar_y + bar_h), (0,0,255), -1)
+        cv2.rectangle(frame, (bar_x, bar_y), (bar_x + frustration_fill, bar_y + bar_h), (0,0,255), -1)
 
-    def draw_active_powerups(self, frame, active_effects):
-        """Draw HUD for active powerups"""
+    def draw_active_powerups(self, frame, active_effects, now=None):
+        """Draw HUD for active powerups (now: session time, defaults to wall clock)"""
+        if now is None:
+            now = time.time()
+        hud = [(effect, data['stack'], int(data['end_time'] - now))
+               for effect, data in active_effects.items()]
+        self._draw_powerup_hud(frame, hud)
+    
+    def _draw_powerup_hud(self, frame, hud):
+        """Draw HUD entries of (effect, stack, remaining seconds)"""
         x = config.SCREEN_WIDTH - 150
         y = 100
         
-        for effect, data in active_effects.items():
-            remaining = int(data['end_time'] - time.time())
-            stack = data['stack']
-            
+        for effect, stack, remaining in hud:
             # Icon Background
             cv2.circle(frame, (x, y), 20, (50, 50, 50), -1)
             
@@ -194,33 +250,36 @@ class GameRenderer:
                 symbol = "-"
                 color = (0, 0, 255)
                 
-            cv2.putText(frame, symbol, (x-7, y+7), cv2.FONT_HERSHEY_SIMPLEX, 0.7, color, 2)
+            self.text.put_text(frame, symbol, (x-7, y+7), cv2.FONT_HERSHEY_SIMPLEX, 0.7, color, 2)
             
             # Text
             text = f"x{stack} ({remaining}s)"
-            cv2.putText(frame, text, (x + 30, y + 5), cv2.FONT_HERSHEY_SIMPLEX, 0.6, color, 2)
+            self.text.put_text(frame, text, (x + 30, y + 5), cv2.FONT_HERSHEY_SIMPLEX, 0.6, color, 2)
             
             y += 50
 
     def draw_fps(self, frame, fps):
         """Draw FPS counter"""
         fps_text = f"FPS: {int(fps)}"
-        cv2.putText(frame, fps_text, (10, 30), 
-                   self.font_small, 0.6, config.COLOR_YELLOW, 2)
+        self.text.put_text(frame, fps_text, (10, 30), 
+                           self.font_small, 0.6, config.COLOR_YELLOW, 2)
+    
+    def draw_recording(self, frame, sample_count):
+        """Draw data recording indicator with the number of recorded samples"""
+        cv2.circle(frame, (30, 60), 10, (0, 0, 255), -1) # Red dot
+        self.text.put_text(frame, f"REC {sample_count}", (50, 65), 
+                           self.font_small, 0.7, (0, 0, 255), 2)
     
     def draw_pause_overlay(self, frame):
-        """Draw pause overlay"""
-        overlay = frame.copy()
-        cv2.rectangle(overlay, (0, 0), (frame.shape[1], frame.shape[2]), 
-                     (0, 0, 0), -1)
-        frame = cv2.addWeighted(frame, 0.7, overlay, 0.3, 0)
+        """Draw pause overlay (darkens the frame in place)"""
+        blend_rect(frame, (0, 0), (frame.shape[1], frame.shape[0]), (0, 0, 0), 0.3)
         
         pause_text = "PAUSED"
-        text_size = cv2.getTextSize(pause_text, self.font_large, 2, 3)[0]
-        text_x = (frame.shape[1] - text_size[0]) // 2
+        text_width = self.text.text_width(pause_text, self.font_large, 2, config.COLOR_CYAN, 3)
+        text_x = (frame.shape[1] - text_width) // 2
         text_y = frame.shape[0] // 2
         
-        cv2.putText(frame, pause_text, (text_x, text_y), 
-                   self.font_large, 2, config.COLOR_CYAN, 3)
+        self.text.put_text(frame, pause_text, (text_x, text_y), 
+                           self.font_large, 2, config.COLOR_CYAN, 3)
         
         return frame
@@ -0,0 +1,233 @@
+"""
+Session Record/Replay
+---------------------
+SessionRecorder stores everything a GameSession consumes per frame
+(timestamp, finger position, emotion tuple, TCN prediction, key presses)
+plus the RNG seeds, as JSON lines. SessionReplayer feeds those inputs back
+into a fresh GameSession without camera or MediaPipe - as fast as the CPU
+allows, or throttled to real time for visual inspection.
+
+Usage:
+    python -m core.replay data/replays/replay_<id>.jsonl [--realtime]
+    python -m core.replay data/replays/replay_<id>.jsonl --video replay.mp4
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import config
+from core.elo_system import EloSystem
+from core.session import GameSession
+
+REPLAY_FORMAT_VERSION = 1
+
+class SessionRecorder:
+    def __init__(self, session, path=None):
+        self.session = session
+        if path is None:
+            os.makedirs(config.REPLAYS_DIR, exist_ok=True)
+            path = os.path.join(config.REPLAYS_DIR, f"replay_{int(time.time())}.jsonl")
+        self.path = path
+        self.frame_count = 0
+        self.file = open(path, 'w')
+
+        header = {
+            'version': REPLAY_FORMAT_VERSION,
+            'powerup_seed': session.powerup_seed,
+            'ai_seed': session.ai_seed,
+            'player_rating': session.elo_system.player_rating,
+            'physics_hz': session.clock.hz,
+            'start_time': session.powerup_manager.current_time,
+            'width': session.game.width,
+            'height': session.game.height
+        }
+        self.file.write(json.dumps(header) + "\n")
+        print(f"Recording replay to {path}")
+
+    def record_frame(self, now, finger_pos, emotion_result, predicted_y, key):
+        """
+        Record one frame of inputs.
+        emotion_result: (emotion, valence, arousal) or None if the frame was paused
+        key: key command handled this frame ('' for none)
+        """
+        game = self.session.game
+        frame = {
+            't': now,
+            'finger': list(finger_pos) if finger_pos else None,
+            'emotion': list(emotion_result) if emotion_result else None,
+            'predicted_y': predicted_y,
+            'key': key,
+            # Checksum of resulting state, used to detect divergence on replay
+            'check': [game.ball.x, game.ball.y, game.player_score, game.ai_score]
+        }
+        self.file.write(json.dumps(frame) + "\n")
+        self.frame_count += 1
+
+    def close(self):
+        if self.file:
+            self.file.close()
+            self.file = None
+            print(f"Saved replay ({self.frame_count} frames) to {self.path}")
+
+
+class SessionReplayer:
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'r') as f:
+            self.header = json.loads(f.readline())
+            self.frames = [json.loads(line) for line in f if line.strip()]
+
+        # Rating is restored from the recording and never written back
+        elo_system = EloSystem(save_file=None)
+        elo_system.player_rating = self.header['player_rating']
+
+        self.session = GameSession(elo_system=elo_system,
+                                   powerup_seed=self.header['powerup_seed'],
+                                   ai_seed=self.header['ai_seed'],
+                                   start_time=self.header['start_time'],
+                                   physics_hz=self.header['physics_hz'],
+                                   verbose=False)
+        self.divergence_frame = None
+
+    def step(self, frame):
+        """Apply one recorded frame to the session"""
+        session = self.session
+        if not session.game.is_paused:
+            emotion, valence, arousal = frame['emotion']
+            session.update(frame['t'], emotion, valence, arousal)
+            session.game.get_state()
+            session.update_ai(frame['predicted_y'])
+        else:
+            session.idle()
+            session.game.get_state()
+
+        session.set_player_target(frame['finger'])
+        if frame['key']:
+            session.handle_key(frame['key'])
+
+    def run(self, realtime=False, renderer=None, on_frame=None):
+        """
+        Replay every frame.
+
+        Args:
+            realtime: sleep between frames to match recorded timestamps
+            renderer: optional callable(session, frame) for visual inspection
+            on_frame: optional callable(session, frame) after each frame
+
+        Returns:
+            Summary dict (frames, scores, rating, elapsed time, divergence)
+        """
+        start = time.perf_counter()
+        t0 = self.frames[0]['t'] if self.frames else 0.0
+        game = self.session.game
+
+        for i, frame in enumerate(self.frames):
+            if realtime:
+                delay = (frame['t'] - t0) - (time.perf_counter() - start)
+                if delay > 0:
+                    time.sleep(delay)
+
+            self.step(frame)
+
+            check = [game.ball.x, game.ball.y, game.player_score, game.ai_score]
+            if self.divergence_frame is None and check != frame['check']:
+                self.divergence_frame = i
+
+            if renderer and renderer(self.session, frame) is False:
+                break
+            if on_frame:
+                on_frame(self.session, frame)
+
+        elapsed = time.perf_counter() - start
+        return {
+            'frames': len(self.frames),
+            'player_score': game.player_score,
+            'ai_score': game.ai_score,
+            'player_rating': self.session.elo_system.player_rating,
+            'elapsed': elapsed,
+            'fps': len(self.frames) / elapsed if elapsed > 0 else 0.0,
+            'divergence_frame': self.divergence_frame
+        }
+
+
+def _prepare_view(session, frame):
+    """Fill the presentation extras of the game state view from a replay frame"""
+    state = session.game.state
+    state.alpha = session.clock.alpha
+    state.predicted_y = frame['predicted_y']
+    state.player_rating = session.elo_system.player_rating
+    state.emotion = frame['emotion'][0] if frame['emotion'] else None
+    state.frustration = session.affective_modulator.frustration_level
+    state.powerups = session.powerup_manager.powerups
+    state.active_effects = session.powerup_manager.active_effects
+    state.now = frame['t']
+    return state
+
+
+def _make_renderer(show_window=True, encoder=None, background=None):
+    """
+    Draw replayed frames offscreen over a background, then show them in a
+    window and/or queue them on a VideoEncoder
+    """
+    import cv2
+    from core.offscreen import OffscreenRenderer
+
+    offscreen = OffscreenRenderer(config.SCREEN_WIDTH, config.SCREEN_HEIGHT, background)
+
+    def draw(session, frame):
+        canvas = offscreen.render(_prepare_view(session, frame))
+        if encoder is not None:
+            encoder.write(canvas)
+        if show_window:
+            cv2.imshow('Gesture Pong Replay', canvas)
+            return (cv2.waitKey(1) & 0xFF) != ord('q')
+        return True
+
+    return draw
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a recorded Gesture Pong session")
+    parser.add_argument('path', help="Replay file (.jsonl)")
+    parser.add_argument('--realtime', action='store_true',
+                        help="Throttle to recorded timing and show the game window")
+    parser.add_argument('--video', default=None,
+                        help="Encode the replay to a video file (.mp4/.avi, .y4m, or '-' for y4m on stdout)")
+    parser.add_argument('--background', default=None,
+                        help="Background image or video for --video (default: synthetic gradient)")
+    args = parser.parse_args()
+
+    # stdout carries the video stream: send all log output to stderr
+    if args.video == '-':
+        sys.stdout = sys.stderr
+
+    replayer = SessionReplayer(args.path)
+    encoder = None
+    if args.video:
+        from core.video_encoder import VideoEncoder
+        encoder = VideoEncoder(args.video, config.SCREEN_WIDTH, config.SCREEN_HEIGHT, config.FPS_TARGET)
+    renderer = None
+    if args.realtime or encoder:
+        renderer = _make_renderer(show_window=args.realtime, encoder=encoder, background=args.background)
+
+    try:
+        summary = replayer.run(realtime=args.realtime, renderer=renderer)
+    finally:
+        if encoder:
+            encoder.close()
+
+    print(f"Replayed {summary['frames']} frames in {summary['elapsed']:.2f}s "
+          f"({summary['fps']:.0f} FPS)")
+    if encoder:
+        print(f"Encoded {encoder.frames_written} frames to {args.video}")
+    print(f"Score: {summary['player_score']} - {summary['ai_score']}, "
+          f"Rating: {int(summary['player_rating'])}")
+    if summary['divergence_frame'] is None:
+        print("Replay matches recording")
+    else:
+        print(f"Replay diverged at frame {summary['divergence_frame']}")
+
+
+if __name__ == "__main__":
+    main()
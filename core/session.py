@@ -0,0 +1,99 @@
+"""
+Game Session
+------------
+Per-frame game logic shared by the live game and the replayer: emotion
+feedback, power-ups, fixed-timestep physics, ELO/affective updates, AI
+and key commands. Nothing in here touches the camera, MediaPipe or the
+display, and all randomness comes from seeded RNGs, so the same inputs
+always produce the same game.
+"""
+import random
+from core.game import PongGame
+from core.clock import FixedTimestepClock
+from core.elo_system import EloSystem
+from core.powerup import PowerUpManager
+from ml.affective_modulator import AffectiveModulator
+from ai.opponent import AIOpponent
+
+class GameSession:
+    def __init__(self, elo_system=None, powerup_seed=None, ai_seed=None,
+                 start_time=None, physics_hz=None, verbose=True):
+        # Seeds are kept so a recorder can store them
+        self.powerup_seed = powerup_seed if powerup_seed is not None else random.randrange(2**32)
+        self.ai_seed = ai_seed if ai_seed is not None else random.randrange(2**32)
+        self.verbose = verbose
+
+        self.game = PongGame()
+        self.elo_system = elo_system or EloSystem()
+        self.affective_modulator = AffectiveModulator()
+        self.powerup_manager = PowerUpManager(self.game,
+                                              rng=random.Random(self.powerup_seed),
+                                              start_time=start_time)
+        self.ai_opponent = AIOpponent(rng=random.Random(self.ai_seed))
+        self.clock = FixedTimestepClock(hz=physics_hz)
+
+        # Apply initial AI parameters
+        self.update_ai_difficulty()
+
+    def update(self, now, emotion, valence, arousal):
+        """Game logic for one unpaused frame: emotion -> power-ups -> physics"""
+        self.affective_modulator.update_emotion(emotion, valence, arousal)
+        self.powerup_manager.update(emotion, now)
+
+        # Fixed timestep, decoupled from camera FPS
+        steps = self.clock.advance(now)
+        for _ in range(steps):
+            result = self.game.update(self.clock.dt)
+            self.handle_result(result)
+
+    def idle(self):
+        """Called instead of update() while paused"""
+        # Don't bank paused time as physics steps
+        self.clock.reset()
+
+    def update_ai(self, predicted_player_y=None):
+        """Move the AI paddle (after prediction for this frame is known)"""
+        self.ai_opponent.update(self.game, predicted_player_y)
+
+    def set_player_target(self, finger_pos):
+        """Point the player paddle at the tracked finger"""
+        if finger_pos:
+            paddle = self.game.player_paddle
+            paddle.set_target(finger_pos[1] - paddle.height // 2)
+
+    def handle_key(self, key):
+        """Apply a game key command ('p' pause, 'r' restart). Returns True if handled."""
+        if key == 'p':
+            self.game.pause()
+        elif key == 'r':
+            self.game.restart()
+        else:
+            return False
+        return True
+
+    def handle_result(self, result):
+        """Update ELO and affective state after a point is scored"""
+        if result == 'player_won':
+            change = self.elo_system.update_rating(player_won=True)
+            self.affective_modulator.update_outcome(player_won=True)
+            if self.verbose:
+                print(f"Player Won! Rating: {int(self.elo_system.player_rating)} (+{int(change)})")
+            self.update_ai_difficulty()
+        elif result == 'ai_won':
+            change = self.elo_system.update_rating(player_won=False)
+            self.affective_modulator.update_outcome(player_won=False)
+            if self.verbose:
+                print(f"AI Won! Rating: {int(self.elo_system.player_rating)} ({int(change)})")
+            self.update_ai_difficulty()
+
+    def update_ai_difficulty(self):
+        """Update AI parameters based on ELO and Affective State"""
+        params = self.elo_system.get_ai_parameters()
+        modifier = self.affective_modulator.get_difficulty_modifier()
+
+        # Apply Pity Mode Modifier
+        if modifier < 1.0:
+            params['speed'] *= modifier
+            params['error_margin'] /= modifier
+
+        self.game.set_ai_parameters(params)
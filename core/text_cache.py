@@ -0,0 +1,135 @@
+"""
+Text Sprite Cache
+-----------------
+Hershey text (cv2.putText) is slow to rasterize, and the HUD redraws the
+same few strings every frame. Each string is rendered once into a coverage
+mask, cropped, tinted and kept in an LRU cache; drawing is then a small
+blit onto the frame.
+
+Strings are split into digits and non-digit runs ("FPS: 30" -> "FPS: ",
+"3", "0"), so a changing counter reuses its per-digit sprites instead of
+caching every number it has ever shown.
+
+Output matches cv2.putText to within +-1 per channel on antialiased edge
+pixels (the blend rounds differently from OpenCV's); fully covered pixels
+are identical.
+"""
+import re
+from collections import OrderedDict
+import cv2
+import numpy as np
+
+MAX_SPRITES = 256
+
+_SEGMENTS = re.compile(r'\d|\D+')
+
+
+class TextSprite:
+    def __init__(self, text, font, scale, color, thickness):
+        (width, height), baseline = cv2.getTextSize(text, font, scale, thickness)
+        # Pen advance to the next segment: drawing text twice measures
+        # one glyph run plus its spacing, without the thickness padding
+        self.advance = cv2.getTextSize(text + text, font, scale, thickness)[0][0] - width
+        self.width = width
+
+        # Render with generous padding around the origin, then crop
+        pad = thickness + 2
+        origin_x, origin_y = pad, pad + height
+        mask = np.zeros((height + baseline + 2 * pad, width + 2 * pad), dtype=np.uint8)
+        cv2.putText(mask, text, (origin_x, origin_y), font, scale, 255, thickness)
+
+        rows = np.flatnonzero(mask.any(axis=1))
+        cols = np.flatnonzero(mask.any(axis=0))
+        if rows.size == 0:
+            # Whitespace only: nothing to draw, just advance
+            self.color = None
+            return
+        y0, y1 = rows[0], rows[-1] + 1
+        x0, x1 = cols[0], cols[-1] + 1
+        mask = mask[y0:y1, x0:x1]
+
+        # Offset of the cropped sprite from the putText origin
+        self.dx = int(x0 - origin_x)
+        self.dy = int(y0 - origin_y)
+
+        # Premultiplied color and inverse coverage, as in CachedLayer
+        color = np.array(color[:3], dtype=np.float32)
+        coverage = mask.astype(np.float32)[..., None] / 255
+        self.color = np.ascontiguousarray(np.rint(coverage * color).astype(np.uint8))
+        if ((mask == 0) | (mask == 255)).all():
+            self.mask = mask
+            self.inv_alpha = None
+        else:
+            self.mask = None
+            self.inv_alpha = cv2.merge([255 - mask] * 3)
+
+    def draw(self, frame, x, y):
+        """Blit with the putText origin (bottom-left of the text) at (x, y)"""
+        if self.color is None:
+            return
+        h, w = self.color.shape[:2]
+        left, top = x + self.dx, y + self.dy
+        color, mask, inv_alpha = self.color, self.mask, self.inv_alpha
+
+        if left < 0 or top < 0 or left + w > frame.shape[1] or top + h > frame.shape[0]:
+            # Clip to frame
+            fx0, fy0 = max(left, 0), max(top, 0)
+            fx1, fy1 = min(left + w, frame.shape[1]), min(top + h, frame.shape[0])
+            if fx0 >= fx1 or fy0 >= fy1:
+                return
+            crop = (slice(fy0 - top, fy1 - top), slice(fx0 - left, fx1 - left))
+            color = color[crop]
+            if mask is not None:
+                mask = mask[crop]
+            else:
+                inv_alpha = inv_alpha[crop]
+            left, top, w, h = fx0, fy0, fx1 - fx0, fy1 - fy0
+
+        roi = frame[top:top + h, left:left + w]
+        if inv_alpha is None:
+            cv2.copyTo(color, mask, roi)
+        else:
+            cv2.multiply(roi, inv_alpha, dst=roi, scale=1 / 255)
+            cv2.add(roi, color, dst=roi)
+
+
+class TextSpriteCache:
+    def __init__(self, max_sprites=MAX_SPRITES):
+        self.max_sprites = max_sprites
+        self.sprites = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def sprite(self, text, font, scale, color, thickness):
+        """Cached sprite for one segment (LRU)"""
+        key = (text, font, scale, tuple(color), thickness)
+        sprite = self.sprites.get(key)
+        if sprite is not None:
+            self.sprites.move_to_end(key)
+            self.hits += 1
+            return sprite
+
+        self.misses += 1
+        sprite = self.sprites[key] = TextSprite(text, font, scale, color, thickness)
+        if len(self.sprites) > self.max_sprites:
+            self.sprites.popitem(last=False)
+        return sprite
+
+    def _segments(self, text, font, scale, color, thickness):
+        return [self.sprite(segment, font, scale, color, thickness)
+                for segment in _SEGMENTS.findall(text)]
+
+    def text_width(self, text, font, scale, color, thickness):
+        """Same as cv2.getTextSize(...)[0][0], from the cached segment advances"""
+        sprites = self._segments(text, font, scale, color, thickness)
+        if not sprites:
+            return 0
+        return sum(s.advance for s in sprites[:-1]) + sprites[-1].width
+
+    def put_text(self, frame, text, org, font, scale, color, thickness):
+        """Drop-in for cv2.putText(frame, text, org, font, scale, color, thickness)"""
+        x, y = int(org[0]), int(org[1])
+        for sprite in self._segments(text, font, scale, color, thickness):
+            sprite.draw(frame, x, y)
+            x += sprite.advance
+        return frame
@@ -0,0 +1,102 @@
+"""
+Background Video Encoder
+------------------------
+Writes frames to a video file from a worker thread so encoding never stalls
+the producer. Frames are copied into a fixed pool of preallocated buffers;
+when every buffer is waiting to be encoded, write() blocks until one is
+free, which bounds memory while still letting headless renders run faster
+than real time.
+
+Backends:
+    .y4m or '-'   raw YUV4MPEG2 (I420) to a file or stdout, e.g. piped to ffmpeg
+    anything else cv2.VideoWriter (codec from the fourcc argument)
+"""
+import queue
+import sys
+import threading
+import cv2
+import numpy as np
+
+DEFAULT_QUEUE_SIZE = 8
+
+class VideoEncoder:
+    def __init__(self, path, width, height, fps, fourcc='mp4v', queue_size=DEFAULT_QUEUE_SIZE):
+        self.path = path
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self.frames_written = 0
+
+        if path == '-' or path.endswith('.y4m'):
+            self.writer = _Y4MWriter(path, width, height, fps)
+        else:
+            self.writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*fourcc), fps, (width, height))
+            if not self.writer.isOpened():
+                raise RuntimeError(f"Failed to open video writer for {path}")
+
+        # Buffer pool: free -> (copy in write) -> pending -> (encode) -> free
+        self.free = queue.Queue()
+        for _ in range(queue_size):
+            self.free.put(np.empty((height, width, 3), dtype=np.uint8))
+        self.pending = queue.Queue()
+        self.error = None
+
+        self.thread = threading.Thread(target=self._run, name="video-encoder", daemon=True)
+        self.thread.start()
+
+    def write(self, frame):
+        """Queue a BGR frame for encoding (copied; blocks only if the encoder is behind)"""
+        if self.error is not None:
+            raise RuntimeError(f"Video encoder failed: {self.error}")
+        buffer = self.free.get()
+        if frame.shape[:2] == (self.height, self.width):
+            np.copyto(buffer, frame)
+        else:
+            cv2.resize(frame, (self.width, self.height), dst=buffer)
+        self.pending.put(buffer)
+
+    def close(self):
+        """Flush queued frames and finalize the file"""
+        if self.thread is None:
+            return
+        self.pending.put(None)
+        self.thread.join()
+        self.thread = None
+        self.writer.release()
+        if self.error is not None:
+            raise RuntimeError(f"Video encoder failed: {self.error}")
+
+    def _run(self):
+        while True:
+            buffer = self.pending.get()
+            if buffer is None:
+                break
+            try:
+                if self.error is None:
+                    self.writer.write(buffer)
+                    self.frames_written += 1
+            except Exception as e:
+                # Keep draining so the producer never deadlocks on a full pool
+                self.error = e
+            self.free.put(buffer)
+
+
+class _Y4MWriter:
+    """Minimal YUV4MPEG2 writer (4:2:0), same interface as cv2.VideoWriter"""
+    def __init__(self, path, width, height, fps):
+        if width % 2 or height % 2:
+            raise ValueError("y4m output needs even frame dimensions")
+        self.file = sys.__stdout__.buffer if path == '-' else open(path, 'wb')
+        self.yuv = np.empty((height * 3 // 2, width), dtype=np.uint8)
+        self.file.write(f"YUV4MPEG2 W{width} H{height} F{int(round(fps * 1000))}:1000 "
+                        f"Ip A1:1 C420jpeg\n".encode('ascii'))
+
+    def write(self, frame):
+        cv2.cvtColor(frame, cv2.COLOR_BGR2YUV_I420, dst=self.yuv)
+        self.file.write(b"FRAME\n")
+        self.file.write(self.yuv.data)
+
+    def release(self):
+        self.file.flush()
+        if self.file is not sys.__stdout__.buffer:
+            self.file.close()
@@ -2,20 +2,23 @@
 ML-Enhanced Gesture Pong - Main Entry Point
 Week 1: Basic game with hand tracking
 """
+import argparse
 import cv2
 import time
 import sys
 
 from vision.camera import Camera
+from vision.frame_source import make_source, PACING_MODES
 from vision.hand_tracker import HandTracker
-from core.game import PongGame
+from vision.preprocess import FramePreprocessor
+from vision.landmark_filter import PointFilter
+from core.session import GameSession
+from core.replay import SessionRecorder
 from core.renderer import GameRenderer
+from core.display import DisplayThread
 from ml.data_collector import DataCollector
-from core.elo_system import EloSystem
-from ml.affective_modulator import AffectiveModulator
 from ml.emotion_detector import EmotionDetector
-from core.powerup import PowerUpManager
-import random
+from ml.emotion_worker import AsyncEmotionDetector
 import config
 from ml.gesture_predictor import GesturePredictor
 
@@ -23,19 +26,30 @@ from ml.gesture_predictor import GesturePredictor
 AI_AVAILABLE = True
 
 class GesturePong:
-    def __init__(self):
-        self.camera = Camera(width=config.SCREEN_WIDTH, height=config.SCREEN_HEIGHT)
+    def __init__(self, record_replay=False, source=None, max_frames=None):
+        self.camera = Camera(width=config.SCREEN_WIDTH, height=config.SCREEN_HEIGHT, source=source)
+        self.max_frames = max_frames
+        self.frames_processed = 0
         self.hand_tracker = HandTracker()
-        self.game = PongGame()
+        self.preprocessor = FramePreprocessor(config.SCREEN_WIDTH, config.SCREEN_HEIGHT)
+        self.finger_filter = PointFilter() if config.FINGER_FILTER else None
         self.renderer = GameRenderer()
+        self.display = DisplayThread(self.renderer, self.hand_tracker, 'ML-Enhanced Gesture Pong')
         self.data_collector = DataCollector()
-        self.elo_system = EloSystem()
-        self.affective_modulator = AffectiveModulator()
-        self.emotion_detector = EmotionDetector()
-        self.powerup_manager = PowerUpManager(self.game)
+        if config.EMOTION_WORKER_PROCESS:
+            self.emotion_detector = AsyncEmotionDetector()
+        else:
+            self.emotion_detector = EmotionDetector()
+        
+        # Deterministic game logic (physics, power-ups, ELO, AI)
+        self.session = GameSession()
+        self.game = self.session.game
+        self.elo_system = self.session.elo_system
+        self.affective_modulator = self.session.affective_modulator
+        self.powerup_manager = self.session.powerup_manager
         
-        # Apply initial AI parameters
-        self._update_ai_difficulty()
+        # Optional input recording for bit-exact replays
+        self.recorder = SessionRecorder(self.session) if record_replay else None
         
         if AI_AVAILABLE:
             self.predictor = GesturePredictor()
@@ -51,8 +65,8 @@ class GesturePong:
             # Start camera
             self.camera.start()
             
-            # Create resizable window
-            cv2.namedWindow('ML-Enhanced Gesture Pong', cv2.WINDOW_NORMAL)
+            # Create resizable window and start presenting frames
+            self.display.start()
             
             print("Starting ML-Enhanced Gesture Pong...")
             print(f"Player Rating: {self.elo_system.player_rating}")
@@ -63,114 +77,122 @@ class GesturePong:
             print("  - Press 'D' to toggle Data Collection")
             print("  - Press 'Q' to quit")
             
+            started = time.perf_counter()
             while self.running:
                 # Calculate FPS
                 self.fps_counter.update()
+                now = time.time()
                 
-                # Read camera frame
-                frame = self.camera.read_frame()
+                # Read newest camera frame (with its capture time)
+                frame, capture_time, _ = self.camera.next_frame()
                 if frame is None:
-                    print("Failed to read camera frame")
-                    break
+                    if self.camera.failed:
+                        print("Failed to read camera frame")
+                        break
+                    # No new frame yet (slow camera start-up, USB hiccup): keep waiting,
+                    # but let the window and the quit key respond meanwhile
+                    self.display.idle()
+                    if ord('q') in self.display.keys:
+                        self.running = False
+                    continue
+                
+                # Convert to RGB once, shared by hand and face tracking
+                rgb = self.preprocessor.to_rgb(frame)
                 
                 # Process Hand Tracking (Always runs for paddle control)
-                self.hand_tracker.process_frame(frame)
+                self.hand_tracker.process_frame(frame, rgb)
                 finger_pos = self.hand_tracker.get_index_finger_position(frame.shape)
                 
+                # Smooth and extrapolate to now for paddle control
+                # (data collection and the TCN keep the raw position)
+                paddle_pos = finger_pos
+                if self.finger_filter:
+                    paddle_pos = self.finger_filter.update(finger_pos, capture_time, time.time())
+                
                 # --- GAME LOGIC (Only if NOT paused) ---
                 predicted_y = None # Default
+                emotion_result = None
                 
                 if not self.game.is_paused:
                     # 1. Process Emotion
-                    emotion, valence, arousal = self.emotion_detector.process_frame(frame)
-                    self.affective_modulator.update_emotion(emotion, valence, arousal)
-                    
-                    # 2. Update Power-Ups
-                    self.powerup_manager.update(emotion)
+                    emotion_result = self.emotion_detector.process_frame(frame, rgb)
+                    emotion = emotion_result[0]
                     
-                    # 3. Update Game Physics
-                    result = self.game.update()
+                    # 2-4. Power-Ups, fixed-timestep physics, scoring
+                    self.session.update(now, *emotion_result)
                     
-                    # 4. Record Data
-                    self.data_collector.record_frame(self.game.get_state(), finger_pos)
+                    # Refresh the shared state view once per tick
+                    game_state = self.game.get_state()
                     
-                    # 5. Handle Scoring
-                    if result == 'player_won':
-                        change = self.elo_system.update_rating(player_won=True)
-                        self.affective_modulator.update_outcome(player_won=True)
-                        print(f"Player Won! Rating: {int(self.elo_system.player_rating)} (+{int(change)})")
-                        self._update_ai_difficulty()
-                    elif result == 'ai_won':
-                        change = self.elo_system.update_rating(player_won=False)
-                        self.affective_modulator.update_outcome(player_won=False)
-                        print(f"AI Won! Rating: {int(self.elo_system.player_rating)} ({int(change)})")
-                        self._update_ai_difficulty()
+                    # 5. Record Data
+                    self.data_collector.record_frame(game_state, finger_pos)
                     
                     # 6. TCN Prediction
                     if self.predictor:
-                        predicted_y = self.predictor.update_buffer(self.game.get_state(), finger_pos)
+                        predicted_y = self.predictor.update_buffer(game_state, finger_pos)
                     
                     # 7. Update AI
-                    self._update_ai(predicted_y)
+                    self.session.update_ai(predicted_y)
                 
                 else:
                     # If paused, keep previous emotion state for rendering
                     emotion = self.emotion_detector.current_emotion
+                    self.session.idle()
+                    game_state = self.game.get_state()
                 
                 # --- RENDERING ---
                 
                 # Update player paddle (Always allow movement even if paused? Or freeze? 
                 # User usually wants to move paddle while paused to get ready. 
                 # But game update is paused. Let's allow paddle move.)
-                if finger_pos:
-                    self.game.player_paddle.set_target(finger_pos[1] - self.game.player_paddle.height // 2)
+                self.session.set_player_target(paddle_pos)
 
-                # Prepare Game State for Renderer
-                game_state = self.game.get_state()
-                if predicted_y is not None:
-                    game_state['predicted_y'] = predicted_y
-                    
-                game_state['player_rating'] = self.elo_system.player_rating
-                game_state['emotion'] = emotion
-                game_state['frustration'] = self.affective_modulator.frustration_level
-                game_state['powerups'] = self.powerup_manager.powerups
-                game_state['active_effects'] = self.powerup_manager.active_effects
-                    
-                frame = self.renderer.render(frame, game_state)
-                
-                # Draw hand landmarks
-                frame = self.hand_tracker.draw_landmarks(frame)
-                frame = self.hand_tracker.draw_finger_indicator(frame, finger_pos)
-                
-                # Draw FPS
-                self.renderer.draw_fps(frame, self.fps_counter.get_fps())
+                # Prepare Game State for Renderer (same view, extras set in place)
+                game_state.alpha = self.session.clock.alpha
+                game_state.predicted_y = predicted_y
+                game_state.player_rating = self.elo_system.player_rating
+                game_state.emotion = emotion
+                game_state.frustration = self.affective_modulator.frustration_level
+                game_state.powerups = self.powerup_manager.powerups
+                game_state.active_effects = self.powerup_manager.active_effects
+                game_state.now = now
                 
-                # Draw Recording Status
-                if self.data_collector.is_recording:
-                    cv2.circle(frame, (30, 60), 10, (0, 0, 255), -1) # Red dot
-                    cv2.putText(frame, f"REC {len(self.data_collector.data_buffer)}", (50, 65), 
-                               cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 0, 255), 2)
+                # Hand the tick to the display (draws and presents on its own thread)
+                recording = len(self.data_collector.data_buffer) if self.data_collector.is_recording else None
+                self.display.publish(frame, game_state, self.hand_tracker.results, finger_pos,
+                                     self.fps_counter.get_fps(), recording, self.game.is_paused)
                 
-                # Draw pause overlay if paused
-                if self.game.is_paused:
-                    frame = self.renderer.draw_pause_overlay(frame)
+                # Handle keyboard input (forwarded by the display)
+                game_key = ''
+                keys = self.display.poll_keys()
+                for i, key in enumerate(keys):
+                    if key == ord('q'):
+                        self.running = False
+                    elif key in (ord('p'), ord('r')):
+                        # One game key per tick keeps replays frame-exact;
+                        # later keys wait for the next tick
+                        if game_key:
+                            self.display.keys.extendleft(reversed(keys[i:]))
+                            break
+                        game_key = chr(key)
+                        self.session.handle_key(game_key)
+                    elif key == ord('d'):
+                        if self.data_collector.is_recording:
+                            self.data_collector.stop_recording()
+                        else:
+                            self.data_collector.start_recording()
                 
-                # Display frame
-                cv2.imshow('ML-Enhanced Gesture Pong', frame)
+                if self.recorder:
+                    self.recorder.record_frame(now, paddle_pos, emotion_result, predicted_y, game_key)
                 
-                # Handle keyboard input
-                key = cv2.waitKey(1) & 0xFF
-                if key == ord('q'):
+                self.frames_processed += 1
+                if self.max_frames and self.frames_processed >= self.max_frames:
                     self.running = False
-                elif key == ord('p'):
-                    self.game.pause()
-                elif key == ord('r'):
-                    self.game.restart()
-                elif key == ord('d'):
-                    if self.data_collector.is_recording:
-                        self.data_collector.stop_recording()
-                    else:
-                        self.data_collector.start_recording()
+            
+            elapsed = time.perf_counter() - started
+            if elapsed > 0:
+                print(f"Processed {self.frames_processed} frames in {elapsed:.2f}s "
+                      f"({self.frames_processed / elapsed:.1f} FPS)")
             
         except Exception as e:
             print(f"Error: {e}")
@@ -179,73 +201,20 @@ class GesturePong:
         
         finally:
             self.data_collector.stop_recording()
+            if self.recorder:
+                self.recorder.close()
             if self.predictor:
                 self.predictor.stop()
             self.cleanup()
     
-    def _update_ai_difficulty(self):
-        """Update AI parameters based on ELO and Affective State"""
-        params = self.elo_system.get_ai_parameters()
-        modifier = self.affective_modulator.get_difficulty_modifier()
-        
-        # Apply Pity Mode Modifier
-        if modifier < 1.0:
-            params['speed'] *= modifier
-            params['error_margin'] /= modifier 
-            
-        self.game.set_ai_parameters(params)
-
-    def _update_ai(self, predicted_player_y=None):
-        """
-        Advanced AI:
-        1. Tracks ball (Basic)
-        2. Uses TCN Prediction to aim away from player (Advanced)
-        3. Applies ELO error (Human-like)
-        """
-        ball = self.game.ball
-        ai_paddle = self.game.ai_paddle
-        player_paddle = self.game.player_paddle
-        
-        # 1. Basic Target: The Ball
-        target_y = ball.y - ai_paddle.height // 2
-        
-        # 2. Advanced Strategy: Aim away from player
-        # Only apply strategy if ball is moving towards AI and we have a prediction
-        if ball.vx > 0 and predicted_player_y is not None:
-            # If player is going UP (low Y), aim DOWN (add offset)
-            # If player is going DOWN (high Y), aim UP (subtract offset)
-            
-            # Center of screen
-            center_y = config.SCREEN_HEIGHT / 2
-            
-            # If player is predicted to be in top half, try to hit to bottom half
-            if predicted_player_y < center_y:
-                strategic_offset = 30 # Aim lower
-            else:
-                strategic_offset = -30 # Aim higher
-                
-            # Blend strategy with basic tracking (30% strategy, 70% tracking)
-            target_y += strategic_offset
-            
-        # 3. Apply ELO Error (Human-like imperfection)
-        # BUG FIX: Apply error ALWAYS, not just when far away.
-        # Otherwise AI snaps to perfection at the last second.
-        error_offset = (random.random() - 0.5) * 2 * self.game.ai_error_margin
-        target_y += error_offset
-            
-        # Move AI
-        if ball.vx > 0:
-            ai_paddle.set_target(target_y)
-        else:
-            # Return to center when idle
-            center_y = self.game.height // 2 - ai_paddle.height // 2
-            ai_paddle.set_target(center_y)
-    
     def cleanup(self):
         """Cleanup resources"""
         print("\nCleaning up...")
+        self.display.stop()
         self.camera.release()
         self.hand_tracker.cleanup()
+        if config.EMOTION_WORKER_PROCESS:
+            self.emotion_detector.close()
         cv2.destroyAllWindows()
         print("Goodbye!")
 
@@ -276,5 +245,23 @@ class FPSCounter:
 
 
 if __name__ == "__main__":
-    game = GesturePong()
+    parser = argparse.ArgumentParser(description="ML-Enhanced Gesture Pong")
+    parser.add_argument('--record', action='store_true',
+                        help=f"Record inputs for deterministic replay (saved to {config.REPLAYS_DIR})")
+    parser.add_argument('--source', choices=['webcam', 'video', 'images', 'synthetic'], default='webcam',
+                        help="Frame source (default: webcam)")
+    parser.add_argument('--input', default=None,
+                        help="Video file for --source video, directory or glob for --source images")
+    parser.add_argument('--camera', type=int, default=0, help="Webcam index")
+    parser.add_argument('--pace', choices=PACING_MODES, default='realtime',
+                        help="Offline source pacing: realtime, fast (every frame, no waiting) or fixed (--fps)")
+    parser.add_argument('--fps', type=float, default=None, help="Frame rate for --pace fixed")
+    parser.add_argument('--loop', action='store_true', help="Loop video/image sources")
+    parser.add_argument('--frames', type=int, default=None,
+                        help="Stop after this many frames (throughput benchmarks)")
+    args = parser.parse_args()
+    
+    source = make_source(args.source, args.input, config.SCREEN_WIDTH, config.SCREEN_HEIGHT,
+                         args.pace, args.fps, args.loop, args.camera)
+    game = GesturePong(record_replay=args.record, source=source, max_frames=args.frames)
     game.run()
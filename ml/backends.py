@@ -0,0 +1,196 @@
+"""
+TCN Inference Backends
+----------------------
+One interface over the ways the gesture TCN can run on the CPU:
+
+    numpy        ml/numpy_tcn.py on the .h5 weights (no TensorFlow)
+    keras        build_tcn_model + load_weights (TensorFlow)
+    tflite       a .tflite export (float16 or int8), via tflite_runtime or tf.lite
+    onnxruntime  an .onnx export
+
+Every backend has predict(x): x is (batch, time, features) float32, the
+result is a (batch, outputs) NumPy array. The exports are produced by
+ml/export_tcn.py. 'auto' times every backend/model file pair (including
+both TFLite exports) whose runtime and file are available and keeps the
+fastest one for this machine.
+"""
+import os
+import time
+import numpy as np
+import config
+
+BACKENDS = ('numpy', 'keras', 'tflite', 'onnxruntime')
+
+DEFAULT_MODEL_PATHS = {
+    'numpy': "models/tcn_gesture_model.h5",
+    'keras': "models/tcn_gesture_model.h5",
+    'tflite': "models/tcn_gesture_model_fp16.tflite",
+    'onnxruntime': "models/tcn_gesture_model.onnx",
+}
+
+# Files written by ml/export_tcn.py, and the backend that runs each
+EXPORT_PATHS = {
+    'fp16': "models/tcn_gesture_model_fp16.tflite",
+    'int8': "models/tcn_gesture_model_int8.tflite",
+    'onnx': "models/tcn_gesture_model.onnx",
+}
+EXPORT_BACKENDS = {'fp16': 'tflite', 'int8': 'tflite', 'onnx': 'onnxruntime'}
+
+# Features per timestep (ball x, y, vx, vy, paddle y, finger y)
+NUM_FEATURES = 6
+
+
+class NumpyBackend:
+    name = 'numpy'
+
+    def __init__(self, path, sequence_length):
+        from ml.numpy_tcn import NumpyTCN
+        self.model = NumpyTCN.from_h5(path)
+
+    def predict(self, x):
+        return self.model.predict(x)
+
+
+class KerasBackend:
+    name = 'keras'
+
+    def __init__(self, path, sequence_length):
+        import tensorflow as tf
+        from ml.tcn_model import build_tcn_model
+        try:
+            # Single-sample inference gains nothing from wide thread pools
+            tf.config.threading.set_intra_op_parallelism_threads(config.TCN_INTRA_OP_THREADS)
+            tf.config.threading.set_inter_op_parallelism_threads(config.TCN_INTER_OP_THREADS)
+        except RuntimeError:
+            # Already initialized (e.g. another model loaded first)
+            pass
+        self.model = build_tcn_model((sequence_length, NUM_FEATURES))
+        self.model.load_weights(path)
+
+        # Compiled graph for the per-frame call; a fixed signature means it is
+        # traced once (on warmup) and never retraced
+        signature = [tf.TensorSpec((1, sequence_length, NUM_FEATURES), tf.float32)]
+        self.forward = tf.function(lambda x: self.model(x, training=False), input_signature=signature)
+
+    def predict(self, x):
+        x = np.asarray(x, dtype=np.float32)
+        if x.shape[0] == 1:
+            return self.forward(x).numpy()
+        return np.asarray(self.model(x, training=False))
+
+
+class TFLiteBackend:
+    name = 'tflite'
+
+    def __init__(self, path, sequence_length):
+        try:
+            from tflite_runtime.interpreter import Interpreter
+        except ImportError:
+            import tensorflow as tf
+            Interpreter = tf.lite.Interpreter
+        self.interpreter = Interpreter(model_path=path, num_threads=config.TCN_INTRA_OP_THREADS)
+        self.interpreter.allocate_tensors()
+        self.input = self.interpreter.get_input_details()[0]
+        self.output = self.interpreter.get_output_details()[0]
+        self.batch = int(self.input['shape'][0])
+
+    def predict(self, x):
+        x = np.asarray(x, dtype=np.float32)
+        if x.shape[0] != self.batch:
+            self.interpreter.resize_tensor_input(self.input['index'], x.shape)
+            self.interpreter.allocate_tensors()
+            self.input = self.interpreter.get_input_details()[0]
+            self.output = self.interpreter.get_output_details()[0]
+            self.batch = x.shape[0]
+
+        # Fully integer models take quantized input and give quantized output
+        if self.input['dtype'] != np.float32:
+            scale, zero_point = self.input['quantization']
+            x = np.round(x / scale + zero_point).astype(self.input['dtype'])
+        self.interpreter.set_tensor(self.input['index'], x)
+        self.interpreter.invoke()
+        y = self.interpreter.get_tensor(self.output['index'])
+        if self.output['dtype'] != np.float32:
+            scale, zero_point = self.output['quantization']
+            y = (y.astype(np.float32) - zero_point) * scale
+        return y
+
+
+class OnnxBackend:
+    name = 'onnxruntime'
+
+    def __init__(self, path, sequence_length):
+        import onnxruntime as ort
+        options = ort.SessionOptions()
+        options.intra_op_num_threads = config.TCN_INTRA_OP_THREADS
+        self.session = ort.InferenceSession(path, options, providers=['CPUExecutionProvider'])
+        self.input_name = self.session.get_inputs()[0].name
+
+    def predict(self, x):
+        return self.session.run(None, {self.input_name: np.asarray(x, dtype=np.float32)})[0]
+
+
+BACKEND_CLASSES = {
+    'numpy': NumpyBackend,
+    'keras': KerasBackend,
+    'tflite': TFLiteBackend,
+    'onnxruntime': OnnxBackend,
+}
+
+
+def benchmark_backend(backend, x, runs=200, warmup=10):
+    """Per-call latencies (seconds) of backend.predict(x)"""
+    for _ in range(warmup):
+        backend.predict(x)
+    latencies = np.empty(runs)
+    for i in range(runs):
+        start = time.perf_counter()
+        backend.predict(x)
+        latencies[i] = time.perf_counter() - start
+    return latencies
+
+
+def auto_candidates():
+    """(backend name, model path) pairs 'auto' tries: the .h5 runtimes and every export"""
+    candidates = [('numpy', DEFAULT_MODEL_PATHS['numpy']), ('keras', DEFAULT_MODEL_PATHS['keras'])]
+    candidates += [(EXPORT_BACKENDS[fmt], path) for fmt, path in EXPORT_PATHS.items()]
+    return candidates
+
+
+def select_backend(sequence_length, candidates=None, runs=100):
+    """Load every available (backend, model file) pair, time a single window and keep the fastest"""
+    candidates = candidates or auto_candidates()
+    x = np.zeros((1, sequence_length, NUM_FEATURES), dtype=np.float32)
+    best, best_path, best_latency = None, None, None
+    for name, path in candidates:
+        if not os.path.exists(path):
+            continue
+        try:
+            backend = BACKEND_CLASSES[name](path, sequence_length)
+        except ImportError:
+            continue
+        latency = float(np.median(benchmark_backend(backend, x, runs)))
+        print(f"  {name:12s} {latency * 1e6:8.1f} us/window  {path}")
+        if best is None or latency < best_latency:
+            best, best_path, best_latency = backend, path, latency
+    if best is None:
+        raise FileNotFoundError("No TCN model file with an available runtime")
+    print(f"  -> using {best.name} ({best_path})")
+    return best
+
+
+def make_backend(name=None, path=None, sequence_length=None):
+    """
+    Build a TCN backend by name ('auto' picks the fastest available).
+    path defaults to DEFAULT_MODEL_PATHS[name].
+    """
+    name = name or config.TCN_BACKEND
+    sequence_length = sequence_length or config.LSTM_SEQUENCE_LENGTH
+    if name == 'auto':
+        return select_backend(sequence_length)
+    if name not in BACKEND_CLASSES:
+        raise ValueError(f"Unknown TCN backend {name!r} (expected 'auto' or one of {BACKENDS})")
+    path = path or DEFAULT_MODEL_PATHS[name]
+    if not os.path.exists(path):
+        raise FileNotFoundError(path)
+    return BACKEND_CLASSES[name](path, sequence_length)
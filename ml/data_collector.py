@@ -37,8 +37,8 @@ class DataCollector:
             return
             
         # Extract data
-        player_paddle = game_state['player_paddle']
-        ball = game_state['ball']
+        player_paddle = game_state.player_paddle
+        ball = game_state.ball
         
         frame_data = {
             'timestamp': time.time(),
@@ -59,7 +59,7 @@ class DataCollector:
             'finger_y': finger_pos[1] if finger_pos else -1,
             
             # Game Context
-            'rally_length': game_state['current_rally_length']
+            'rally_length': game_state.current_rally_length
         }
         
         self.data_buffer.append(frame_data)
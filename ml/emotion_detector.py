@@ -36,17 +36,18 @@ class EmotionDetector:
         self.debug_open = 0.0
         self.debug_brow = 0.0
         
-    def process_frame(self, frame):
+    def process_frame(self, frame, rgb=None):
         """
         Process frame and estimate emotion.
+        rgb: the frame already converted to RGB (e.g. FramePreprocessor.to_rgb)
         Returns: (emotion_label, valence, arousal)
         """
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        rgb_frame = rgb if rgb is not None else cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
         results = self.face_mesh.process(rgb_frame)
         
         if results.multi_face_landmarks:
             landmarks = results.multi_face_landmarks[0]
-            self._analyze_landmarks(landmarks, frame.shape)
+            self._analyze_landmarks(landmarks, rgb_frame.shape)
             return self.current_emotion, self.valence, self.arousal_level
             
         return None, 0.0, 0.0
@@ -0,0 +1,77 @@
+"""
+Asynchronous Emotion Detection
+------------------------------
+Runs EmotionDetector (Face Mesh with refined landmarks) in a BusWorker
+process so the affective path never delays hand tracking and paddle control.
+
+Every config.EMOTION_DETECTION_INTERVAL ticks, if the worker is idle, the
+RGB frame is handed over through a shared-memory FrameBus: only its sequence
+number is sent, and only the small (emotion, valence, arousal) result comes
+back. process_frame() never waits and returns the latest published result.
+"""
+import cv2
+import config
+from vision.frame_bus import FrameBus, BusWorker
+
+# Own bus: one slot being analyzed, one for the next submission
+OWN_BUS_SLOTS = 2
+
+
+def emotion_handler():
+    """BusWorker handler factory (runs in the worker, so MediaPipe loads there)"""
+    from ml.emotion_detector import EmotionDetector
+    detector = EmotionDetector()
+
+    def handle(rgb, seq, timestamp):
+        return detector.process_frame(None, rgb)
+    return handle
+
+
+class AsyncEmotionDetector:
+    def __init__(self, width=config.SCREEN_WIDTH, height=config.SCREEN_HEIGHT,
+                 interval=config.EMOTION_DETECTION_INTERVAL, bus=None):
+        """
+        bus: shared FrameBus of RGB frames published by the caller (then pass
+             seq to process_frame). By default the detector owns a small bus
+             and publishes only the frames it submits.
+        """
+        self.interval = max(1, interval)
+        self.tick = 0
+        self.next_submit = 0
+        self.latest = (None, 0.0, 0.0)
+        self.current_emotion = "Neutral"
+        self.frames_submitted = 0
+
+        self.owns_bus = bus is None
+        self.bus = FrameBus((height, width, 3), OWN_BUS_SLOTS) if self.owns_bus else bus
+        self.worker = BusWorker(self.bus, emotion_handler, name="emotion-worker")
+
+    def process_frame(self, frame, rgb=None, seq=None):
+        """
+        Submit the frame if it's due and the worker is idle; never blocks.
+        rgb: the frame already converted to RGB (converted here otherwise)
+        seq: the frame's sequence number on a shared bus
+        Returns: latest (emotion_label, valence, arousal)
+        """
+        if self.worker.poll():
+            self.latest = self.worker.latest
+            if self.latest[0] is not None:
+                self.current_emotion = self.latest[0]
+
+        if not self.worker.busy and self.tick >= self.next_submit:
+            if seq is None:
+                if rgb is None:
+                    rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+                seq = self.bus.publish(rgb)
+            self.worker.submit(seq)
+            self.next_submit = self.tick + self.interval
+            self.frames_submitted += 1
+        self.tick += 1
+
+        return self.latest
+
+    def close(self):
+        """Stop the worker and free the bus if we own it"""
+        self.worker.close()
+        if self.owns_bus:
+            self.bus.close()
@@ -0,0 +1,143 @@
+"""
+TCN Export Tool
+---------------
+Converts the trained GestureTCN (ml/tcn_model.py + models/tcn_gesture_model.h5)
+for the backends in ml/backends.py:
+
+    models/tcn_gesture_model_fp16.tflite   TFLite, float16 weights
+    models/tcn_gesture_model_int8.tflite   TFLite, int8 weights and activations
+                                           (calibrated on recorded sessions)
+    models/tcn_gesture_model.onnx          ONNX (needs tf2onnx)
+
+then reports each export's error against the Keras model (in pixels of
+predicted paddle Y) and its single-window latency on this machine.
+
+Usage:
+    python -m ml.export_tcn [--formats fp16 int8 onnx] [--sessions "data/gameplay_sessions/*.csv"]
+"""
+import argparse
+import glob
+import os
+import numpy as np
+import config
+from ml.backends import (BACKEND_CLASSES, EXPORT_BACKENDS, EXPORT_PATHS, KerasBackend, NumpyBackend,
+                         NUM_FEATURES, benchmark_backend)
+
+MODEL_PATH = "models/tcn_gesture_model.h5"
+
+# Windows used to calibrate int8 ranges and to measure the accuracy delta
+CALIBRATION_WINDOWS = 500
+EVAL_WINDOWS = 2000
+
+
+def load_session_windows(pattern, sequence_length):
+    """Feature windows from recorded gameplay CSVs, normalized as in train_tcn.py"""
+    import pandas as pd
+    columns = ['ball_x', 'ball_y', 'ball_vx', 'ball_vy', 'player_y', 'finger_y']
+    scale = np.array([config.SCREEN_WIDTH, config.SCREEN_HEIGHT, 20.0, 20.0,
+                      config.SCREEN_HEIGHT, config.SCREEN_HEIGHT], dtype=np.float32)
+    windows = []
+    for path in sorted(glob.glob(pattern)):
+        data = pd.read_csv(path)[columns].to_numpy(dtype=np.float32) / scale
+        for i in range(len(data) - sequence_length + 1):
+            windows.append(data[i:i + sequence_length])
+    if not windows:
+        return np.empty((0, sequence_length, NUM_FEATURES), dtype=np.float32)
+    return np.stack(windows)
+
+
+def export_tflite(model, path, quantization, calibration=None):
+    import tensorflow as tf
+    converter = tf.lite.TFLiteConverter.from_keras_model(model)
+    converter.optimizations = [tf.lite.Optimize.DEFAULT]
+    if quantization == 'fp16':
+        converter.target_spec.supported_types = [tf.float16]
+    else:
+        def representative_dataset():
+            for window in calibration:
+                yield [window[None].astype(np.float32)]
+        converter.representative_dataset = representative_dataset
+        # Integer kernels inside; float input/output so callers don't change
+        converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+    with open(path, 'wb') as f:
+        f.write(converter.convert())
+
+
+def export_onnx(model, path, sequence_length):
+    import tensorflow as tf
+    import tf2onnx
+    spec = [tf.TensorSpec((None, sequence_length, NUM_FEATURES), tf.float32, name="sequence")]
+    tf2onnx.convert.from_keras(model, input_signature=spec, opset=13, output_path=path)
+
+
+def accuracy_report(reference, exports, windows, sequence_length):
+    """Print error vs the Keras model and latency for each export"""
+    expected = reference.predict(windows)
+    single = windows[:1]
+    rows = [('keras', reference, 0.0, 0.0)]
+    for fmt, path in exports:
+        try:
+            backend = BACKEND_CLASSES[EXPORT_BACKENDS[fmt]](path, sequence_length)
+        except ImportError as e:
+            print(f"  {fmt}: runtime not available ({e})")
+            continue
+        error = np.abs(backend.predict(windows) - expected) * config.SCREEN_HEIGHT
+        rows.append((fmt, backend, float(error.mean()), float(error.max())))
+
+    numpy_backend = NumpyBackend(MODEL_PATH, sequence_length)
+    error = np.abs(numpy_backend.predict(windows) - expected) * config.SCREEN_HEIGHT
+    rows.append(('numpy', numpy_backend, float(error.mean()), float(error.max())))
+
+    print(f"\nAccuracy vs Keras over {len(windows)} windows (px of paddle Y), latency per window:")
+    print(f"  {'format':8s} {'mean err':>9s} {'max err':>9s} {'median us':>10s} {'p99 us':>9s}")
+    for fmt, backend, mean_error, max_error in rows:
+        latencies = benchmark_backend(backend, single) * 1e6
+        print(f"  {fmt:8s} {mean_error:9.3f} {max_error:9.3f} "
+              f"{np.median(latencies):10.1f} {np.percentile(latencies, 99):9.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export the gesture TCN to TFLite/ONNX")
+    parser.add_argument('--formats', nargs='+', choices=list(EXPORT_PATHS), default=list(EXPORT_PATHS))
+    parser.add_argument('--sessions', default=os.path.join(config.GAMEPLAY_SESSIONS_DIR, "*.csv"),
+                        help="Recorded session CSVs for int8 calibration and evaluation")
+    args = parser.parse_args()
+
+    sequence_length = config.LSTM_SEQUENCE_LENGTH
+    reference = KerasBackend(MODEL_PATH, sequence_length)
+
+    windows = load_session_windows(args.sessions, sequence_length)
+    if len(windows) == 0:
+        print(f"No recorded sessions match {args.sessions}")
+        if 'int8' in args.formats:
+            print("Skipping int8 (needs recorded sessions to calibrate)")
+            args.formats = [f for f in args.formats if f != 'int8']
+        # Evaluate on random windows instead
+        windows = np.random.default_rng(0).random((EVAL_WINDOWS, sequence_length, NUM_FEATURES),
+                                                   dtype=np.float32)
+        calibration = None
+    else:
+        print(f"Loaded {len(windows)} windows from recorded sessions")
+        rng = np.random.default_rng(0)
+        calibration = windows[rng.choice(len(windows), min(CALIBRATION_WINDOWS, len(windows)), replace=False)]
+        windows = windows[rng.choice(len(windows), min(EVAL_WINDOWS, len(windows)), replace=False)]
+
+    exports = []
+    for fmt in args.formats:
+        path = EXPORT_PATHS[fmt]
+        print(f"Exporting {fmt} -> {path}")
+        try:
+            if fmt == 'onnx':
+                export_onnx(reference.model, path, sequence_length)
+            else:
+                export_tflite(reference.model, path, fmt, calibration)
+        except ImportError as e:
+            print(f"  skipped: {e}")
+            continue
+        exports.append((fmt, path))
+
+    accuracy_report(reference, exports, windows, sequence_length)
+
+
+if __name__ == "__main__":
+    main()
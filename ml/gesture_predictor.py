@@ -1,23 +1,37 @@
 """
 Gesture Predictor Module
 Loads trained TCN model and predicts future finger position
+(TensorFlow is only imported for the 'keras' backend, see ml/backends.py)
 """
-import tensorflow as tf
-from tensorflow import keras
 import numpy as np
 import config
-import os
 
-from ml.tcn_model import build_tcn_model
+from ml.backends import make_backend, benchmark_backend, NUM_FEATURES
 
 import threading
 import queue
 
 class GesturePredictor:
-    def __init__(self, model_path="models/tcn_gesture_model.h5"):
+    def __init__(self, model_path=None, backend=None):
+        """
+        model_path: model file for the backend (default: DEFAULT_MODEL_PATHS)
+        backend: 'numpy', 'keras', 'tflite', 'onnxruntime' or 'auto' (default: config.TCN_BACKEND)
+        """
+        self.backend = backend or config.TCN_BACKEND
         self.model = None
-        self.sequence_buffer = []
         self.sequence_length = config.LSTM_SEQUENCE_LENGTH # 30 frames
+        
+        # Doubled ring buffer: frame i is written to rows i and i + length, so the
+        # last `length` frames are always the contiguous view window[pos:pos + length]
+        self.window = np.zeros((2 * self.sequence_length, NUM_FEATURES), dtype=np.float32)
+        self.window_pos = 0
+        self.frames_seen = 0
+        
+        # Two staging arrays handed to the worker in turn: when the queue is empty the
+        # worker holds at most the one sent last, so the other is free to overwrite
+        self.staging = [np.zeros((1, self.sequence_length, NUM_FEATURES), dtype=np.float32)
+                        for _ in range(2)]
+        self.next_staging = 0
         self.is_ready = False
         self.latest_prediction = None
         self.running = True
@@ -26,26 +40,28 @@ class GesturePredictor:
         self.input_queue = queue.Queue(maxsize=1)
         
         try:
-            if os.path.exists(model_path):
-                print(f"Loading TCN model from {model_path}...")
-                
-                # STRATEGY CHANGE: Build architecture locally, then load weights.
-                input_shape = (self.sequence_length, 6) # 6 features
-                self.model = build_tcn_model(input_shape)
-                self.model.load_weights(model_path)
-                
-                self.is_ready = True
-                print("TCN Model loaded successfully! (Async Mode)")
-                
-                # Start background worker thread
-                self.worker_thread = threading.Thread(target=self._prediction_worker, daemon=True)
-                self.worker_thread.start()
-                
-            else:
-                print(f"Warning: Model not found at {model_path}")
+            print(f"Loading TCN model ({self.backend} backend)...")
+            self.model = make_backend(self.backend, model_path, self.sequence_length)
+            self.backend = self.model.name
+            self._warm_up()
+            self.is_ready = True
+            print(f"TCN Model loaded successfully! (Async Mode, {self.backend})")
+            
+            # Start background worker thread
+            self.worker_thread = threading.Thread(target=self._prediction_worker, daemon=True)
+            self.worker_thread.start()
+        except FileNotFoundError as e:
+            print(f"Warning: Model not found at {e}")
         except Exception as e:
             print(f"Error loading model: {e}")
             
+    def _warm_up(self):
+        """Run the model on a dummy window so tracing/allocation happens now, not mid-match"""
+        latencies = benchmark_backend(self.model, self.staging[0], runs=config.TCN_LATENCY_RUNS,
+                                      warmup=config.TCN_WARMUP_RUNS) * 1000
+        print(f"TCN inference: median {np.median(latencies):.2f} ms, "
+              f"p99 {np.percentile(latencies, 99):.2f} ms ({len(latencies)} timed calls)")
+            
     def _prediction_worker(self):
         """Background thread that runs the heavy model inference"""
         while self.running:
@@ -54,7 +70,7 @@ class GesturePredictor:
                 input_seq = self.input_queue.get(timeout=0.1)
                 
                 # Run inference
-                prediction = self.model(input_seq, training=False)
+                prediction = self.model.predict(input_seq)
                 
                 # Update latest prediction
                 self.latest_prediction = float(prediction[0][0]) * config.SCREEN_HEIGHT
@@ -70,28 +86,30 @@ class GesturePredictor:
             return None
             
         # Extract features
-        player_paddle = game_state['player_paddle']
-        ball = game_state['ball']
-        
-        features = [
-            ball.x / config.SCREEN_WIDTH,
-            ball.y / config.SCREEN_HEIGHT,
-            ball.vx / 20.0,
-            ball.vy / 20.0,
-            player_paddle.y / config.SCREEN_HEIGHT,
-            (finger_pos[1] if finger_pos else 0) / config.SCREEN_HEIGHT
-        ]
-        
-        self.sequence_buffer.append(features)
+        player_paddle = game_state.player_paddle
+        ball = game_state.ball
         
-        if len(self.sequence_buffer) > self.sequence_length:
-            self.sequence_buffer.pop(0)
+        length = self.sequence_length
+        pos = self.window_pos
+        features = self.window[pos]
+        features[0] = ball.x / config.SCREEN_WIDTH
+        features[1] = ball.y / config.SCREEN_HEIGHT
+        features[2] = ball.vx / 20.0
+        features[3] = ball.vy / 20.0
+        features[4] = player_paddle.y / config.SCREEN_HEIGHT
+        features[5] = (finger_pos[1] if finger_pos else 0) / config.SCREEN_HEIGHT
+        self.window[pos + length] = features
+        self.window_pos = (pos + 1) % length
+        self.frames_seen += 1
             
         # If buffer is full, try to send to worker
-        if len(self.sequence_buffer) == self.sequence_length:
+        if self.frames_seen >= length:
             # Only send if worker is ready (queue empty) to avoid backlog
             if self.input_queue.empty():
-                input_seq = np.array([self.sequence_buffer])
+                input_seq = self.staging[self.next_staging]
+                start = self.window_pos
+                np.copyto(input_seq[0], self.window[start:start + length])
+                self.next_staging ^= 1
                 self.input_queue.put(input_seq)
             
         return self.latest_prediction
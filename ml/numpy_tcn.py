@@ -0,0 +1,78 @@
+"""
+NumPy TCN Runtime
+-----------------
+Forward pass of GestureTCN (ml/tcn_model.py) in plain NumPy, with the
+weights read from the Keras .h5 file by h5py. Lets the game run the gesture
+predictor without importing TensorFlow.
+
+Each causal dilated Conv1D is done as im2col: the input is zero-padded at
+the front by (kernel_size - 1) * dilation, the kernel_size shifted views are
+stacked into (batch, time, kernel_size * channels) and multiplied with the
+kernel reshaped to (kernel_size * channels, filters) in one matmul. Dropout
+is an identity at inference.
+
+Parity with build_tcn_model is checked in tests/test_numpy_tcn.py
+(python -m pytest tests; the Keras comparison is skipped without TensorFlow).
+"""
+import h5py
+import numpy as np
+
+# Must match build_tcn_model
+DILATIONS = (1, 2, 4, 8)
+KERNEL_SIZE = 3
+
+
+def load_tcn_weights(path):
+    """
+    Read weights from a Keras .h5 file (full model or save_weights).
+    Returns the arrays in Model.get_weights() order:
+    [kernel, bias] per conv layer, then dense kernel and bias.
+    """
+    weights = []
+    with h5py.File(path, 'r') as f:
+        group = f['model_weights'] if 'model_weights' in f else f
+        for layer_name in group.attrs['layer_names']:
+            layer = group[layer_name]
+            for weight_name in layer.attrs['weight_names']:
+                weights.append(np.asarray(layer[weight_name], dtype=np.float32))
+    expected = 2 * len(DILATIONS) + 2
+    if len(weights) != expected:
+        raise ValueError(f"{path}: expected {expected} weight arrays, found {len(weights)}")
+    return weights
+
+
+class NumpyTCN:
+    def __init__(self, weights):
+        """weights: as returned by load_tcn_weights (or Model.get_weights())"""
+        # Kernels flattened to (kernel_size * in, out), matching the im2col layout
+        self.convs = [(np.asarray(weights[2 * i], dtype=np.float32).reshape(-1, weights[2 * i].shape[2]),
+                       np.asarray(weights[2 * i + 1], dtype=np.float32), dilation)
+                      for i, dilation in enumerate(DILATIONS)]
+        self.dense_kernel = np.asarray(weights[-2], dtype=np.float32)
+        self.dense_bias = np.asarray(weights[-1], dtype=np.float32)
+
+    @classmethod
+    def from_h5(cls, path):
+        return cls(load_tcn_weights(path))
+
+    def predict(self, x):
+        """x: (batch, time, features). Returns (batch, outputs) float32."""
+        x = np.asarray(x, dtype=np.float32)
+        batch, steps, channels = x.shape
+        for kernel, bias, dilation in self.convs:
+            pad = (KERNEL_SIZE - 1) * dilation
+            padded = np.zeros((batch, pad + steps, channels), dtype=np.float32)
+            padded[:, pad:] = x
+            # Tap k sees x[t - (KERNEL_SIZE - 1 - k) * dilation]
+            cols = np.concatenate([padded[:, k * dilation:k * dilation + steps]
+                                   for k in range(KERNEL_SIZE)], axis=2)
+            x = cols.reshape(batch * steps, -1) @ kernel
+            x += bias
+            np.maximum(x, 0, out=x)
+            channels = x.shape[1]
+            x = x.reshape(batch, steps, channels)
+        pooled = x.mean(axis=1)
+        return pooled @ self.dense_kernel + self.dense_bias
+
+    __call__ = predict
+
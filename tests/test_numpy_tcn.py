@@ -0,0 +1,80 @@
+"""
+Parity tests for the NumPy TCN runtime (ml/numpy_tcn.py) on the shipped
+models/tcn_gesture_model.h5.
+"""
+import os
+import numpy as np
+import pytest
+
+from ml.numpy_tcn import DILATIONS, NumpyTCN, load_tcn_weights
+
+MODEL_PATH = os.path.join(os.path.dirname(__file__), os.pardir, "models", "tcn_gesture_model.h5")
+SEQUENCE_LENGTH = 30
+NUM_FEATURES = 6
+
+# NumpyTCN outputs for seeded_windows(), recorded from the shipped weights
+PINNED_OUTPUTS = np.array([0.446892, 0.46806347, 0.46587458, 0.4480091], dtype=np.float32)
+PINNED_ZERO_OUTPUT = 0.6226384
+
+
+def seeded_windows(count=4):
+    return np.random.default_rng(1234).random((count, SEQUENCE_LENGTH, NUM_FEATURES), dtype=np.float32)
+
+
+@pytest.fixture(scope="module")
+def numpy_model():
+    return NumpyTCN.from_h5(MODEL_PATH)
+
+
+def test_weights_in_get_weights_order():
+    weights = load_tcn_weights(MODEL_PATH)
+    shapes = [w.shape for w in weights]
+    assert shapes == [(3, NUM_FEATURES, 64), (64,),
+                      (3, 64, 64), (64,), (3, 64, 64), (64,), (3, 64, 64), (64,),
+                      (64, 1), (1,)]
+
+
+def test_pinned_outputs(numpy_model):
+    np.testing.assert_allclose(numpy_model.predict(seeded_windows())[:, 0], PINNED_OUTPUTS, atol=1e-5)
+    zeros = np.zeros((1, SEQUENCE_LENGTH, NUM_FEATURES), dtype=np.float32)
+    np.testing.assert_allclose(numpy_model.predict(zeros)[0, 0], PINNED_ZERO_OUTPUT, atol=1e-5)
+
+
+def test_batch_matches_single_windows(numpy_model):
+    windows = seeded_windows()
+    batched = numpy_model.predict(windows)
+    for window, expected in zip(windows, batched):
+        np.testing.assert_allclose(numpy_model.predict(window[None])[0], expected, atol=1e-6)
+
+
+def per_tap_reference(weights, window):
+    """Straightforward causal conv loop, independent of the im2col layout"""
+    x = window
+    for i, dilation in enumerate(DILATIONS):
+        kernel, bias = weights[2 * i], weights[2 * i + 1]
+        out = np.tile(bias, (len(x), 1))
+        for t in range(len(x)):
+            for k in range(kernel.shape[0]):
+                src = t - (kernel.shape[0] - 1 - k) * dilation
+                if src >= 0:
+                    out[t] += x[src] @ kernel[k]
+        x = np.maximum(out, 0)
+    return x.mean(axis=0) @ weights[-2] + weights[-1]
+
+
+def test_matches_per_tap_reference(numpy_model):
+    weights = load_tcn_weights(MODEL_PATH)
+    for window in seeded_windows(2):
+        np.testing.assert_allclose(numpy_model.predict(window[None])[0],
+                                   per_tap_reference(weights, window), atol=1e-5)
+
+
+def test_matches_keras(numpy_model):
+    pytest.importorskip("tensorflow")
+    from ml.tcn_model import build_tcn_model
+
+    keras_model = build_tcn_model((SEQUENCE_LENGTH, NUM_FEATURES))
+    keras_model.load_weights(MODEL_PATH)
+    windows = np.random.default_rng(0).random((64, SEQUENCE_LENGTH, NUM_FEATURES), dtype=np.float32)
+    expected = keras_model.predict(windows, verbose=0)
+    np.testing.assert_allclose(numpy_model.predict(windows), expected, atol=1e-4)
@@ -0,0 +1,46 @@
+"""
+TextSpriteCache (core/text_cache.py) against cv2.putText / cv2.getTextSize.
+"""
+import cv2
+import numpy as np
+import pytest
+
+from core.text_cache import TextSpriteCache
+
+CASES = [
+    ("PAUSED", cv2.FONT_HERSHEY_SIMPLEX, 2, (255, 255, 0), 3),
+    ("PAUSED", cv2.FONT_HERSHEY_SIMPLEX, 1.0, (255, 255, 255), 2),
+    ("FPS: 30", cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2),
+    ("Player 12 - 7 AI", cv2.FONT_HERSHEY_DUPLEX, 1, (255, 255, 255), 2),
+    ("REC 1024", cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 0, 255), 1),
+]
+
+
+@pytest.mark.parametrize("text, font, scale, color, thickness", CASES)
+def test_put_text_matches_opencv(text, font, scale, color, thickness):
+    cache = TextSpriteCache()
+    expected = np.full((200, 600, 3), (40, 90, 160), dtype=np.uint8)
+    actual = expected.copy()
+    cv2.putText(expected, text, (20, 100), font, scale, color, thickness)
+    # Warm the cache first so the compared draw comes from cached sprites
+    cache.put_text(expected.copy(), text, (20, 100), font, scale, color, thickness)
+    cache.put_text(actual, text, (20, 100), font, scale, color, thickness)
+    assert cache.hits > 0
+    np.testing.assert_allclose(actual, expected, atol=1)
+
+
+def test_put_text_clipped_at_frame_edge():
+    cache = TextSpriteCache()
+    expected = np.full((60, 100, 3), 128, dtype=np.uint8)
+    actual = expected.copy()
+    args = (cv2.FONT_HERSHEY_SIMPLEX, 1.0, (255, 255, 255), 2)
+    cv2.putText(expected, "FPS: 30", (-10, 15), *args)
+    cache.put_text(actual, "FPS: 30", (-10, 15), *args)
+    np.testing.assert_allclose(actual, expected, atol=1)
+
+
+@pytest.mark.parametrize("text, font, scale, color, thickness", CASES)
+def test_text_width_matches_get_text_size(text, font, scale, color, thickness):
+    cache = TextSpriteCache()
+    expected = cv2.getTextSize(text, font, scale, thickness)[0][0]
+    assert cache.text_width(text, font, scale, color, thickness) == expected
@@ -1,58 +1,144 @@
 """
 Camera capture and management
+
+A capture thread grabs frames continuously into a small ring of
+preallocated buffers, so the game loop always gets the newest frame instead
+of whatever the driver has queued up. Frames the loop didn't get to are
+overwritten, never queued: latency is bounded by one capture period.
+
+Frames come from a FrameSource (webcam by default). An offline source paced
+'fast' runs in lockstep instead: each frame waits until the reader took the
+previous one, so benchmarks see every frame exactly once.
 """
-import cv2
+import threading
+import numpy as np
+from vision.preprocess import FramePreprocessor
+from vision.frame_source import WebcamSource
+
+# Ring slots: one being written, one published as latest, one held by the reader
+RING_SIZE = 3
 
 class Camera:
-    def __init__(self, camera_index=0, width=800, height=600):
+    def __init__(self, camera_index=0, width=800, height=600, source=None):
+        """source: FrameSource to capture from (default: webcam camera_index)"""
         self.camera_index = camera_index
         self.width = width
         self.height = height
-        self.cap = None
+        self.source = source or WebcamSource(camera_index, width, height)
+        self.name = camera_index if source is None else type(source).__name__
         self.is_open = False
-    
+
+        # Ring of processed (resized + mirrored) frames
+        self.preprocessor = FramePreprocessor(width, height)
+        self.buffers = [np.empty((height, width, 3), dtype=np.uint8) for _ in range(RING_SIZE)]
+        self.timestamps = [0.0] * RING_SIZE
+        self.seqs = [0] * RING_SIZE
+        self.latest_index = -1
+        self.held_index = -1
+        self.seq = 0
+        self.last_read_seq = 0
+        self.failed = False
+
+        self.frame_ready = threading.Condition()
+        self.thread = None
+
     def start(self):
         """Initialize and start camera"""
-        self.cap = cv2.VideoCapture(self.camera_index)
-        
-        if not self.cap.isOpened():
-            raise RuntimeError(f"Failed to open camera {self.camera_index}")
-        
-        # Set camera properties
-        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.width)
-        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.height)
-        self.cap.set(cv2.CAP_PROP_FPS, 30)
-        
+        self.source.open()
+
         self.is_open = True
-        print(f"Camera {self.camera_index} started: {self.width}x{self.height}")
-    
+        self.failed = False
+        self.thread = threading.Thread(target=self._capture_loop, name="camera", daemon=True)
+        self.thread.start()
+        print(f"Camera {self.name} started: {self.width}x{self.height}")
+
+    def _capture_loop(self):
+        """Capture thread: read, convert into a free ring slot, publish"""
+        try:
+            self._capture_frames()
+        finally:
+            # Wake up a waiting reader: no more frames are coming
+            with self.frame_ready:
+                self.failed = True
+                self.frame_ready.notify_all()
+
+    def _capture_frames(self):
+        raw = None
+        while self.is_open:
+            if self.source.lockstep:
+                # Offline benchmark: hand over every frame, drop none
+                with self.frame_ready:
+                    self.frame_ready.wait_for(lambda: self.last_read_seq >= self.seq or not self.is_open)
+                if not self.is_open:
+                    return
+
+            raw, timestamp = self.source.read(raw)
+            if raw is None:
+                print("Failed to read frame from camera" if self.source.live else "End of frame source")
+                return
+
+            # Any slot that is neither the published frame nor held by the reader
+            with self.frame_ready:
+                index = next(i for i in range(RING_SIZE)
+                             if i != self.latest_index and i != self.held_index)
+
+            # Resize frame to match configured dimensions, then flip
+            # horizontally for mirror effect (no allocation)
+            self.preprocessor.prepare(raw, self.buffers[index])
+
+            with self.frame_ready:
+                self.seq += 1
+                self.seqs[index] = self.seq
+                self.timestamps[index] = timestamp
+                self.latest_index = index
+                self.frame_ready.notify_all()
+
+    def latest(self):
+        """
+        Newest captured frame without waiting.
+        Returns: (frame, capture timestamp, sequence number), or (None, None, 0)
+        before the first frame. The frame stays valid until the next
+        latest()/next_frame()/read_frame() call.
+        """
+        with self.frame_ready:
+            if self.latest_index < 0:
+                return None, None, 0
+            self.held_index = self.latest_index
+            self.last_read_seq = self.seqs[self.held_index]
+            self.frame_ready.notify_all()
+            return self.buffers[self.held_index], self.timestamps[self.held_index], self.last_read_seq
+
+    def next_frame(self, timeout=1.0):
+        """
+        Like latest(), but waits for a frame newer than the last one returned.
+        Returns (None, None, seq) on timeout; failed tells whether the stream has ended.
+        """
+        with self.frame_ready:
+            self.frame_ready.wait_for(lambda: self.seq > self.last_read_seq or self.failed,
+                                      timeout=timeout)
+            if self.seq <= self.last_read_seq:
+                return None, None, self.last_read_seq
+        return self.latest()
+
     def read_frame(self):
-        """Read a frame from camera"""
+        """Read the next camera frame (None on failure)"""
         if not self.is_open:
             return None
-        
-        ret, frame = self.cap.read()
-        
-        if not ret:
-            print("Failed to read frame from camera")
-            return None
-        
-        # Resize frame to match configured dimensions
-        if frame.shape[1] != self.width or frame.shape[0] != self.height:
-            frame = cv2.resize(frame, (self.width, self.height))
-            
-        # Flip frame horizontally for mirror effect
-        frame = cv2.flip(frame, 1)
-        
-        return frame
-    
+
+        return self.next_frame()[0]
+
     def release(self):
         """Release camera resources"""
-        if self.cap is not None:
-            self.cap.release()
-            self.is_open = False
+        if self.thread is not None or self.is_open:
+            with self.frame_ready:
+                self.is_open = False
+                self.frame_ready.notify_all()
+            if self.thread is not None:
+                self.thread.join(timeout=1.0)
+                self.thread = None
+            self.source.release()
             print("Camera released")
-    
+
     def __del__(self):
         """Cleanup on deletion"""
         self.release()
@@ -0,0 +1,196 @@
+"""
+Shared-Memory Frame Bus
+-----------------------
+A fixed ring of frame slots in multiprocessing.shared_memory, so vision
+workers in other processes can read camera frames without pickling them.
+Per frame, only a sequence number crosses process boundaries.
+
+Layout of the shared block:
+    int64   write_seq             sequence number of the newest frame
+    int64   slot_seq[slots]       seqlock per slot: -1 while being written
+    float64 timestamp[slots]      capture time of each slot's frame
+    uint8   frames[slots, H, W, C]
+
+Frame seq lives in slot (seq - 1) % slots. There is a single producer. A
+reader takes a read-only view of the slot and checks is_current(seq) after
+using it: if the producer has lapped the ring in the meantime, the result
+is discarded instead of trusting a torn frame.
+
+BusWorker runs any handler in a separate process attached to the bus:
+handler_factory() is called once in the worker and returns
+handler(frame, seq, timestamp) -> result.
+"""
+import multiprocessing as mp
+import queue
+from multiprocessing import shared_memory
+import numpy as np
+
+DEFAULT_SLOTS = 4
+
+class FrameBus:
+    def __init__(self, shape, slots=DEFAULT_SLOTS, name=None):
+        """
+        Create a bus (name=None) or attach to an existing one by name.
+        shape: frame shape, e.g. (height, width, 3) uint8
+        """
+        self.shape = tuple(shape)
+        self.slots = slots
+        frame_size = int(np.prod(self.shape))
+        header_size = 8 * (1 + 2 * slots)
+
+        self.owner = name is None
+        if self.owner:
+            self.shm = shared_memory.SharedMemory(create=True, size=header_size + slots * frame_size)
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+        self.name = self.shm.name
+
+        buf = self.shm.buf
+        self.write_seq = np.ndarray((1,), dtype=np.int64, buffer=buf, offset=0)
+        self.slot_seq = np.ndarray((slots,), dtype=np.int64, buffer=buf, offset=8)
+        self.timestamps = np.ndarray((slots,), dtype=np.float64, buffer=buf, offset=8 * (1 + slots))
+        self.frames = np.ndarray((slots,) + self.shape, dtype=np.uint8, buffer=buf, offset=header_size)
+        if self.owner:
+            self.write_seq[0] = 0
+            self.slot_seq.fill(0)
+
+        # Read-only views handed to readers
+        self.views = []
+        for i in range(slots):
+            view = self.frames[i].view()
+            view.flags.writeable = False
+            self.views.append(view)
+
+    def spec(self):
+        """Arguments to attach to this bus from another process"""
+        return (self.shape, self.slots, self.name)
+
+    def publish(self, frame, timestamp=0.0):
+        """Copy a frame into the next slot (single producer). Returns its seq."""
+        seq = int(self.write_seq[0]) + 1
+        slot = (seq - 1) % self.slots
+        self.slot_seq[slot] = -1
+        np.copyto(self.frames[slot], frame)
+        self.timestamps[slot] = timestamp
+        self.slot_seq[slot] = seq
+        self.write_seq[0] = seq
+        return seq
+
+    def latest_seq(self):
+        return int(self.write_seq[0])
+
+    def read(self, seq):
+        """(read-only frame view, timestamp) for seq, or (None, None) if it was overwritten"""
+        if seq <= 0:
+            return None, None
+        slot = (seq - 1) % self.slots
+        if self.slot_seq[slot] != seq:
+            return None, None
+        return self.views[slot], float(self.timestamps[slot])
+
+    def is_current(self, seq):
+        """True if seq's slot still holds that frame (check after reading)"""
+        return seq > 0 and self.slot_seq[(seq - 1) % self.slots] == seq
+
+    def close(self):
+        if self.shm is None:
+            return
+        # Drop our views before releasing the buffer
+        self.write_seq = self.slot_seq = self.timestamps = self.frames = None
+        self.views = []
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+        self.shm = None
+
+
+def _bus_worker(spec, handler_factory, requested, wake, stop, results):
+    """Worker process: run the handler on each requested frame"""
+    shape, slots, name = spec
+    bus = FrameBus(shape, slots, name=name)
+    handler = handler_factory()
+    handled = 0
+    try:
+        while not stop.is_set():
+            if not wake.wait(timeout=0.1):
+                continue
+            wake.clear()
+            seq = requested.value
+            if seq == handled:
+                continue
+            handled = seq
+            frame, timestamp = bus.read(seq)
+            if frame is None:
+                # Already overwritten: report back so the caller resubmits
+                results.put((seq, False, None))
+                continue
+            try:
+                result = handler(frame, seq, timestamp)
+            except Exception as e:
+                # Keep serving; report the frame as failed so the caller resubmits
+                print(f"Bus worker handler error on frame {seq}: {e}")
+                results.put((seq, False, None))
+                continue
+            # Discard the result if the producer lapped the ring meanwhile
+            results.put((seq, bus.is_current(seq), result))
+    finally:
+        bus.close()
+
+
+class BusWorker:
+    """Runs handler_factory() in a separate process attached to a FrameBus"""
+    def __init__(self, bus, handler_factory, name="bus-worker"):
+        # Spawn (not fork): the parent may already run MediaPipe threads
+        ctx = mp.get_context('spawn')
+        self.requested = ctx.Value('q', 0, lock=False)
+        self.wake = ctx.Event()
+        self.stop_event = ctx.Event()
+        self.results = ctx.Queue()
+        self.busy = False
+        self.latest = None
+        self.latest_seq = 0
+        self.name = name
+        self.died = False
+        self.process = ctx.Process(target=_bus_worker, name=name, daemon=True,
+                                   args=(bus.spec(), handler_factory, self.requested, self.wake,
+                                         self.stop_event, self.results))
+        self.process.start()
+
+    def submit(self, seq):
+        """Ask the worker to process frame seq (only the number is sent)"""
+        self.busy = True
+        self.requested.value = seq
+        self.wake.set()
+
+    def poll(self):
+        """Collect finished results. Returns True if a new result arrived."""
+        updated = False
+        while True:
+            try:
+                seq, valid, result = self.results.get_nowait()
+            except queue.Empty:
+                break
+            if seq == self.requested.value:
+                self.busy = False
+            if valid and seq > self.latest_seq:
+                self.latest_seq = seq
+                self.latest = result
+                updated = True
+
+        # A dead worker will never answer: don't stay busy on it forever
+        if self.busy and self.process is not None and not self.process.is_alive():
+            if not self.died:
+                print(f"{self.name} exited (code {self.process.exitcode}); its results will stop updating")
+                self.died = True
+            self.busy = False
+        return updated
+
+    def close(self):
+        if self.process is None:
+            return
+        self.stop_event.set()
+        self.wake.set()
+        self.process.join(timeout=2.0)
+        if self.process.is_alive():
+            self.process.terminate()
+        self.process = None
@@ -0,0 +1,230 @@
+"""
+Frame Sources
+-------------
+Where Camera gets its images from, so the whole pipeline can run (and be
+benchmarked reproducibly) without a webcam:
+
+    WebcamSource     cv2.VideoCapture(index), paced by the device
+    VideoFileSource  frames from a video file
+    ImageSequence    sorted PNG/JPG files from a directory or glob
+    SyntheticSource  procedural frames (moving hand-coloured blob on a gradient)
+
+Pacing for everything except the webcam:
+    realtime  the file's own frame rate (SyntheticSource: FPS_TARGET)
+    fixed     a given frame rate
+    fast      as fast as the consumer takes them; Camera then hands over
+              every frame instead of dropping stale ones
+
+read() returns (frame, timestamp) or (None, None) at the end of the stream.
+"""
+import glob
+import math
+import os
+import time
+import cv2
+import numpy as np
+import config
+
+PACING_MODES = ('realtime', 'fast', 'fixed')
+
+class FrameSource:
+    # Live sources deliver frames on their own clock
+    live = False
+
+    def __init__(self, pacing='realtime', fps=None, loop=False):
+        if pacing not in PACING_MODES:
+            raise ValueError(f"Unknown pacing mode {pacing!r} (expected one of {PACING_MODES})")
+        self.pacing = pacing
+        self.fps = fps
+        self.loop = loop
+        self.frame_index = 0
+        self.start_time = None
+
+    @property
+    def lockstep(self):
+        """True if every frame must reach the consumer (no stale-frame dropping)"""
+        return self.pacing == 'fast' and not self.live
+
+    def open(self):
+        self.frame_index = 0
+        self.start_time = None
+
+    def native_fps(self):
+        return config.FPS_TARGET
+
+    def _pace(self):
+        """Sleep until this frame is due"""
+        if self.start_time is None:
+            self.start_time = time.perf_counter()
+        if self.pacing == 'fast':
+            return
+        fps = self.fps if (self.pacing == 'fixed' and self.fps) else self.native_fps()
+        delay = self.start_time + self.frame_index / fps - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+
+    def read(self, out=None):
+        """Next frame, paced. out: optional buffer to reuse."""
+        self._pace()
+        frame = self._next_frame(out)
+        if frame is None and self.loop and self.frame_index > 0:
+            self._rewind()
+            frame = self._next_frame(out)
+        if frame is None:
+            return None, None
+        self.frame_index += 1
+        return frame, time.time()
+
+    def _next_frame(self, out):
+        raise NotImplementedError
+
+    def _rewind(self):
+        raise NotImplementedError
+
+    def release(self):
+        pass
+
+
+class WebcamSource(FrameSource):
+    live = True
+
+    def __init__(self, camera_index=0, width=800, height=600):
+        super().__init__(pacing='fast')
+        self.camera_index = camera_index
+        self.width = width
+        self.height = height
+        self.cap = None
+
+    def open(self):
+        super().open()
+        self.cap = cv2.VideoCapture(self.camera_index)
+
+        if not self.cap.isOpened():
+            raise RuntimeError(f"Failed to open camera {self.camera_index}")
+
+        # Set camera properties
+        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.width)
+        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.height)
+        self.cap.set(cv2.CAP_PROP_FPS, 30)
+        # Keep as little as possible queued in the driver (not all backends support it)
+        self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
+    def read(self, out=None):
+        # The device paces itself; timestamp right after the grab
+        if not self.cap.grab():
+            return None, None
+        timestamp = time.time()
+        ret, frame = self.cap.retrieve(out)
+        if not ret:
+            return None, None
+        self.frame_index += 1
+        return frame, timestamp
+
+    def release(self):
+        if self.cap is not None:
+            self.cap.release()
+            self.cap = None
+
+
+class VideoFileSource(FrameSource):
+    def __init__(self, path, pacing='realtime', fps=None, loop=False):
+        super().__init__(pacing, fps, loop)
+        self.path = path
+        self.cap = None
+
+    def open(self):
+        super().open()
+        self.cap = cv2.VideoCapture(self.path)
+        if not self.cap.isOpened():
+            raise RuntimeError(f"Failed to open video {self.path}")
+
+    def native_fps(self):
+        fps = self.cap.get(cv2.CAP_PROP_FPS) if self.cap is not None else 0
+        return fps if fps > 0 else config.FPS_TARGET
+
+    def _next_frame(self, out):
+        ret, frame = self.cap.read(out)
+        return frame if ret else None
+
+    def _rewind(self):
+        self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+
+    def release(self):
+        if self.cap is not None:
+            self.cap.release()
+            self.cap = None
+
+
+class ImageSequence(FrameSource):
+    def __init__(self, pattern, pacing='realtime', fps=None, loop=False):
+        """pattern: a directory (all .png/.jpg files in it) or a glob"""
+        super().__init__(pacing, fps, loop)
+        if os.path.isdir(pattern):
+            paths = [p for ext in ('*.png', '*.jpg', '*.jpeg')
+                     for p in glob.glob(os.path.join(pattern, ext))]
+        else:
+            paths = glob.glob(pattern)
+        self.paths = sorted(paths)
+        self.position = 0
+
+    def open(self):
+        super().open()
+        if not self.paths:
+            raise RuntimeError("Image sequence is empty")
+        self.position = 0
+
+    def _next_frame(self, out):
+        if self.position >= len(self.paths):
+            return None
+        frame = cv2.imread(self.paths[self.position])
+        self.position += 1
+        return frame
+
+    def _rewind(self):
+        self.position = 0
+
+
+class SyntheticSource(FrameSource):
+    """Deterministic procedural frames: frame i is always the same image"""
+    def __init__(self, width=800, height=600, pacing='realtime', fps=None, num_frames=None):
+        super().__init__(pacing, fps)
+        self.width = width
+        self.height = height
+        self.num_frames = num_frames
+
+        # Static gradient background, blob drawn on a copy each frame
+        ramp = np.linspace(40, 120, width, dtype=np.float32)[None, :]
+        self.background = np.empty((height, width, 3), dtype=np.uint8)
+        self.background[:, :, 0] = ramp * 0.9
+        self.background[:, :, 1] = ramp
+        self.background[:, :, 2] = ramp * 0.8
+
+    def _next_frame(self, out):
+        if self.num_frames is not None and self.frame_index >= self.num_frames:
+            return None
+        if out is None or out.shape != self.background.shape:
+            out = np.empty_like(self.background)
+        np.copyto(out, self.background)
+
+        # Hand-coloured palm plus index finger moving up and down
+        t = self.frame_index / config.FPS_TARGET
+        cx = int(self.width * 0.25)
+        cy = int(self.height * (0.5 + 0.35 * math.sin(2 * math.pi * 0.4 * t)))
+        skin = (120, 160, 215)
+        cv2.ellipse(out, (cx, cy + 60), (55, 70), 0, 0, 360, skin, -1)
+        cv2.rectangle(out, (cx - 10, cy - 40), (cx + 10, cy + 20), skin, -1)
+        return out
+
+
+def make_source(kind, path=None, width=800, height=600, pacing='realtime', fps=None,
+                loop=False, camera_index=0):
+    """Build a FrameSource from command line style arguments"""
+    if kind == 'webcam':
+        return WebcamSource(camera_index, width, height)
+    if kind == 'video':
+        return VideoFileSource(path, pacing, fps, loop)
+    if kind == 'images':
+        return ImageSequence(path, pacing, fps, loop)
+    if kind == 'synthetic':
+        return SyntheticSource(width, height, pacing, fps)
+    raise ValueError(f"Unknown frame source {kind!r}")
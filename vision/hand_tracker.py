@@ -1,11 +1,19 @@
 """
 MediaPipe hand tracking wrapper
+
+ROI mode (config.HAND_ROI_TRACKING): once a hand is found, the next frame
+only feeds a crop around the last landmark bounding box, padded by the
+hand's size and its recent motion. Landmarks are mapped back to full-frame
+coordinates, so callers see the same results either way. When the crop
+loses the hand, the same tick falls back to full-frame detection.
 """
 import mediapipe as mp
 import cv2
+import numpy as np
+import config
 
 class HandTracker:
-    def __init__(self, max_hands=1, detection_confidence=0.8, tracking_confidence=0.5):
+    def __init__(self, max_hands=1, detection_confidence=0.8, tracking_confidence=0.5, roi_mode=None):
         self.mp_hands = mp.solutions.hands
         self.hands = self.mp_hands.Hands(
             max_num_hands=max_hands,
@@ -14,14 +22,97 @@ class HandTracker:
         )
         self.mp_drawing = mp.solutions.drawing_utils
         self.results = None
+        
+        # Crop-and-track state. Every tick's crop is shifted and resized, so the
+        # crop detector runs in static image mode: MediaPipe's own tracking ROI
+        # and landmark smoothing would carry over in the previous crop's coordinates.
+        self.roi_mode = config.HAND_ROI_TRACKING if roi_mode is None else roi_mode
+        self.roi_hands = None
+        if self.roi_mode:
+            self.roi_hands = self.mp_hands.Hands(
+                static_image_mode=True,
+                max_num_hands=max_hands,
+                min_detection_confidence=detection_confidence,
+                min_tracking_confidence=tracking_confidence
+            )
+        self.roi = None            # (x0, y0, x1, y1) crop for the next frame
+        self.last_center = None    # hand bbox center (px) at the last detection
+        self.velocity = (0.0, 0.0) # px per tick
+        self.roi_frames = 0
+        self.full_frames = 0
     
-    def process_frame(self, frame):
-        """Process frame and detect hands"""
+    def process_frame(self, frame, rgb=None):
+        """Process frame and detect hands (rgb: frame already converted to RGB)"""
         # Convert BGR to RGB for MediaPipe
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        rgb_frame = rgb if rgb is not None else cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        
+        if self.roi is not None:
+            results = self._process_roi(rgb_frame)
+            if results.multi_hand_landmarks:
+                self.roi_frames += 1
+                self.results = results
+                self._update_roi(rgb_frame.shape)
+                return self.results
+            # Lost the hand in the crop: fall back to the full frame
+            self.roi = None
+            self.last_center = None
+        
+        self.full_frames += 1
         self.results = self.hands.process(rgb_frame)
+        if self.roi_mode:
+            self._update_roi(rgb_frame.shape)
         return self.results
     
+    def _process_roi(self, rgb_frame):
+        """Track inside the crop and map landmarks back to frame coordinates"""
+        x0, y0, x1, y1 = self.roi
+        crop = np.ascontiguousarray(rgb_frame[y0:y1, x0:x1])
+        crop.flags.writeable = False
+        results = self.roi_hands.process(crop)
+        
+        if results.multi_hand_landmarks:
+            h, w = rgb_frame.shape[:2]
+            scale_x, scale_y = (x1 - x0) / w, (y1 - y0) / h
+            offset_x, offset_y = x0 / w, y0 / h
+            for hand_landmarks in results.multi_hand_landmarks:
+                for landmark in hand_landmarks.landmark:
+                    landmark.x = offset_x + landmark.x * scale_x
+                    landmark.y = offset_y + landmark.y * scale_y
+        return results
+    
+    def _update_roi(self, frame_shape):
+        """Crop for the next tick: last bbox, padded by hand size and velocity"""
+        if not self.results or not self.results.multi_hand_landmarks:
+            self.roi = None
+            self.last_center = None
+            return
+        
+        h, w = frame_shape[:2]
+        landmarks = self.results.multi_hand_landmarks[0].landmark
+        xs = [landmark.x * w for landmark in landmarks]
+        ys = [landmark.y * h for landmark in landmarks]
+        center_x = (min(xs) + max(xs)) / 2
+        center_y = (min(ys) + max(ys)) / 2
+        size = max(max(xs) - min(xs), max(ys) - min(ys))
+        
+        if self.last_center is not None:
+            self.velocity = (center_x - self.last_center[0], center_y - self.last_center[1])
+        else:
+            self.velocity = (0.0, 0.0)
+        self.last_center = (center_x, center_y)
+        
+        # Lead the crop by one tick of motion and widen it by the speed
+        vx, vy = self.velocity
+        half = max(size * (1 + config.HAND_ROI_PADDING) + abs(vx) + abs(vy),
+                   config.HAND_ROI_MIN_SIZE) / 2
+        cx, cy = center_x + vx, center_y + vy
+        x0, x1 = max(0, int(cx - half)), min(w, int(cx + half))
+        y0, y1 = max(0, int(cy - half)), min(h, int(cy + half))
+        if x1 - x0 < 2 or y1 - y0 < 2:
+            self.roi = None
+            return
+        self.roi = (x0, y0, x1, y1)
+    
     def get_index_finger_position(self, frame_shape):
         """Extract index finger tip position (landmark 8)"""
         if not self.results or not self.results.multi_hand_landmarks:
@@ -54,10 +145,12 @@ class HandTracker:
         
         return landmarks
     
-    def draw_landmarks(self, frame):
-        """Draw hand landmarks on frame"""
-        if self.results and self.results.multi_hand_landmarks:
-            for hand_landmarks in self.results.multi_hand_landmarks:
+    def draw_landmarks(self, frame, results=None):
+        """Draw hand landmarks on frame (results: a previous process_frame() result, default latest)"""
+        if results is None:
+            results = self.results
+        if results and results.multi_hand_landmarks:
+            for hand_landmarks in results.multi_hand_landmarks:
                 self.mp_drawing.draw_landmarks(
                     frame, 
                     hand_landmarks, 
@@ -80,3 +173,15 @@ class HandTracker:
         """Release MediaPipe resources"""
         if self.hands:
             self.hands.close()
+        if self.roi_hands:
+            self.roi_hands.close()
+
+
+def hand_handler():
+    """BusWorker handler factory: index finger position for frames on a FrameBus"""
+    tracker = HandTracker()
+
+    def handle(rgb, seq, timestamp):
+        tracker.process_frame(None, rgb)
+        return tracker.get_index_finger_position(rgb.shape)
+    return handle
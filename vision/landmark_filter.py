@@ -0,0 +1,89 @@
+"""
+Landmark Filtering
+------------------
+One-Euro filter (Casiez et al. 2012) for tracked landmarks: heavy smoothing
+while the hand is still, little smoothing (and so little lag) when it moves
+fast. The filtered velocity is then used to extrapolate the point from its
+capture time to "now", hiding the camera and inference latency.
+"""
+import math
+import config
+
+def _smoothing_factor(cutoff, dt):
+    tau = 1.0 / (2 * math.pi * cutoff)
+    return 1.0 / (1.0 + tau / dt)
+
+
+class OneEuroFilter:
+    """Scalar One-Euro filter with its filtered derivative"""
+    def __init__(self, min_cutoff=1.0, beta=0.0, d_cutoff=1.0):
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+        self.reset()
+
+    def reset(self):
+        self.value = None
+        self.velocity = 0.0
+        self.timestamp = None
+
+    def update(self, x, timestamp):
+        """Filter sample x taken at timestamp (seconds). Returns the filtered value."""
+        if self.value is None or timestamp <= self.timestamp:
+            if self.value is None:
+                self.value = x
+            self.timestamp = timestamp
+            return self.value
+
+        dt = timestamp - self.timestamp
+        self.timestamp = timestamp
+
+        # Smoothed derivative drives the adaptive cutoff
+        raw_velocity = (x - self.value) / dt
+        a_d = _smoothing_factor(self.d_cutoff, dt)
+        self.velocity += a_d * (raw_velocity - self.velocity)
+
+        cutoff = self.min_cutoff + self.beta * abs(self.velocity)
+        a = _smoothing_factor(cutoff, dt)
+        self.value += a * (x - self.value)
+        return self.value
+
+    def predict(self, timestamp):
+        """Value extrapolated to timestamp with the filtered velocity"""
+        return self.value + self.velocity * (timestamp - self.timestamp)
+
+
+class PointFilter:
+    """
+    One-Euro filter for a 2D landmark (e.g. the index finger tip) with
+    forward prediction to the current time.
+    """
+    def __init__(self, min_cutoff=None, beta=None, d_cutoff=None, max_lead=None):
+        min_cutoff = config.FINGER_FILTER_MIN_CUTOFF if min_cutoff is None else min_cutoff
+        beta = config.FINGER_FILTER_BETA if beta is None else beta
+        d_cutoff = config.FINGER_FILTER_D_CUTOFF if d_cutoff is None else d_cutoff
+        self.max_lead = config.FINGER_PREDICT_MAX_LEAD if max_lead is None else max_lead
+        self.x = OneEuroFilter(min_cutoff, beta, d_cutoff)
+        self.y = OneEuroFilter(min_cutoff, beta, d_cutoff)
+
+    def reset(self):
+        self.x.reset()
+        self.y.reset()
+
+    def update(self, point, capture_time, now=None):
+        """
+        Filter a point captured at capture_time and extrapolate it to now
+        (lead capped at max_lead seconds). A lost point (None) resets the
+        filter so the next detection doesn't glide in from the old position.
+        Returns: (x, y) as ints, or None
+        """
+        if point is None:
+            self.reset()
+            return None
+
+        self.x.update(point[0], capture_time)
+        self.y.update(point[1], capture_time)
+
+        lead = 0.0 if now is None else min(max(now - capture_time, 0.0), self.max_lead)
+        target = capture_time + lead
+        return (int(round(self.x.predict(target))), int(round(self.y.predict(target))))
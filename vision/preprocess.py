@@ -0,0 +1,34 @@
+"""
+Frame Preprocessing
+-------------------
+Resize, mirror and BGR -> RGB conversion into preallocated buffers (cv2
+dst= arguments), so a tick allocates no full-size frames. The RGB image is
+converted once and handed to every MediaPipe consumer (hands, face mesh) as
+a shared read-only view, which also lets MediaPipe skip its defensive copy.
+"""
+import cv2
+import numpy as np
+
+class FramePreprocessor:
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.resized = np.empty((height, width, 3), dtype=np.uint8)
+        self.rgb = np.empty((height, width, 3), dtype=np.uint8)
+
+        # Read-only alias of self.rgb handed to the trackers
+        self.rgb_view = self.rgb.view()
+        self.rgb_view.flags.writeable = False
+
+    def prepare(self, raw, dst):
+        """Resize raw camera image to the configured size and mirror it into dst"""
+        if raw.shape[1] != self.width or raw.shape[0] != self.height:
+            cv2.resize(raw, (self.width, self.height), dst=self.resized)
+            raw = self.resized
+        cv2.flip(raw, 1, dst=dst)
+        return dst
+
+    def to_rgb(self, frame):
+        """Convert a BGR frame once; returns the shared read-only RGB view"""
+        cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self.rgb)
+        return self.rgb_view